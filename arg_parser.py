@@ -14,17 +14,149 @@
 # @package arg_parser
 # @note
 # This script initializes an Inspector object with the provided parameters and executes the 'run' method.
+# With '--batch' the folder path is the top-level root and one Inspector is run for each of its
+# session folders inside the same interpreter.
+# With '--profile' the run is profiled with cProfile and the profile is saved next to the JSON reports.
+# With '--results_path' the flattened check results of every folder are appended to one columnar file.
 
 
 
 try:
     from inspector import *
     import argparse
+    import cProfile
+    import io
+    import pstats
 except ImportError as e:
     print(f"Error: {e}")
     exit(1)
 
 
+def run_batch(root_path: str, enable_report: bool, json_path: str, light_mode: bool, excel_path: str, workers: int = 1, excel_streaming: bool = False, incremental: bool = False,
+              only: list = None, check_threads: int = 1, prefetch: int = 0,
+              timing_csv: bool = False, report_format: str = 'pretty', results_exporter: ResultsExporter = None):
+    """!
+    @brief Runs the Inspector on every session folder of a top-level root.
+
+    @details
+    Replaces the per-folder 'python3 arg_parser.py' launches of the shell script and the GUI,
+    so the libraries and the configuration file are loaded only once.
+    The reports of the session 'name' are saved in '<json_path>/json_report/name' and '<excel_path>/excel_report/name'.
+
+    @param root_path (str): Top-level folder containing the session folders (e.g. /home/mt/Public/1).
+    @param enable_report (bool): Enable or disable JSON report generation.
+    @param json_path (str): Base path for saving JSON reports.
+    @param light_mode (bool): Enable light mode.
+    @param excel_path (str): Base path for saving Excel reports.
+    @param workers (int): Number of processes used by each Inspector.
+    @param excel_streaming (bool): Write the Excel reports with the streaming backend.
+    @param incremental (bool): Skip the recording folders unchanged since the last run.
+    @param only (list): Names of the checks to run, all the registered checks if None.
+    @param check_threads (int): Number of threads running the checks of one recorded file.
+    @param prefetch (int): Number of recording folders read ahead in background threads.
+    @param timing_csv (bool): Write the timings of each session to '<json_path>/json_report/name/timing.csv'.
+    @param report_format (str): Format of the JSON reports: 'pretty', 'compact' or 'jsonl'.
+    @param results_exporter (ResultsExporter): Exporter receiving the flattened results of every session, None to disable.
+    """
+    for name in sorted(os.listdir(root_path)):
+        if not os.path.isdir(os.path.join(root_path, name)):
+            continue
+        session_json_path = os.path.join(json_path, 'json_report', name)
+        inspector = Inspector(root_path=os.path.join(root_path, name), enable_report=enable_report,
+                              json_path=session_json_path, light_mode=light_mode,
+                              excel_path=os.path.join(excel_path, 'excel_report', name), workers=workers,
+                              excel_streaming=excel_streaming, incremental=incremental, only=only,
+                              check_threads=check_threads, prefetch=prefetch,
+                              timing_csv=os.path.join(session_json_path, 'timing.csv') if timing_csv else None,
+                              report_format=report_format, results_exporter=results_exporter)
+        inspector.run()
+
+
+def collapsed_stacks(stats: pstats.Stats, max_depth: int = 64, min_fraction: float = 1e-4) -> list:
+    """!
+    @brief Converts a cProfile call graph into flamegraph-compatible collapsed stacks.
+
+    @details
+    cProfile only records caller/callee pairs, so the stacks are rebuilt from the entry points:
+    the time of a function reached through a caller is its share of the cumulative time of that call.
+    Recursive calls are cut at their first repetition, and branches shorter than 'min_fraction' of the
+    profiled time are dropped to keep the number of stacks bounded.
+
+    @param stats (pstats.Stats): The loaded profile.
+    @param max_depth (int): Maximum depth of a stack.
+    @param min_fraction (float): Smallest share of the profiled time kept as a separate branch.
+    @return List of 'module:function;module:function;... microseconds' lines.
+    """
+    def label(function):
+        file_name, line, name = function
+        return f"{os.path.basename(file_name)}:{name}:{line}" if line else name
+
+    callees = {}
+    for function, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, caller_cumulative) in callers.items():
+            callees.setdefault(caller, []).append((function, caller_cumulative))
+
+    lines = {}
+    min_share = stats.total_tt * min_fraction
+
+    def walk(function, stack, share):
+        _, _, total_time, cumulative_time, _ = stats.stats[function]
+        stack = stack + [label(function)]
+        scale = share / cumulative_time if cumulative_time else 0.0
+        own_time = total_time * scale
+        if own_time > 0:
+            key = ';'.join(stack)
+            lines[key] = lines.get(key, 0.0) + own_time
+        if len(stack) >= max_depth:
+            return
+        for callee, callee_cumulative in callees.get(function, []):
+            if label(callee) not in stack and callee_cumulative * scale >= min_share:
+                walk(callee, stack, callee_cumulative * scale)
+
+    # The entry points are the functions called from outside the profiled code
+    for function, (_, _, _, cumulative_time, callers) in stats.stats.items():
+        if not any(caller in stats.stats for caller in callers):
+            walk(function, [], cumulative_time)
+
+    return [f"{stack} {int(seconds * 1e6)}" for stack, seconds in lines.items() if int(seconds * 1e6) > 0]
+
+
+def save_profile(profiler: cProfile.Profile, output_path: str, top: int = 30, collapsed: bool = False) -> list:
+    """!
+    @brief Saves a profile as '.pstats', a table of the slowest functions and optionally collapsed stacks.
+
+    @param profiler (cProfile.Profile): The profiler, already disabled.
+    @param output_path (str): Folder receiving 'inspector_profile.pstats', 'inspector_profile_top.txt'
+                              and 'inspector_profile.collapsed'.
+    @param top (int): Number of functions in the table.
+    @param collapsed (bool): Also write the collapsed stacks, e.g. for flamegraph.pl or speedscope.
+    @return List of the written files.
+    """
+    os.makedirs(output_path, exist_ok=True)
+    written = []
+
+    pstats_path = os.path.join(output_path, 'inspector_profile.pstats')
+    profiler.dump_stats(pstats_path)
+    written.append(pstats_path)
+
+    table = io.StringIO()
+    stats = pstats.Stats(profiler, stream=table)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    top_path = os.path.join(output_path, 'inspector_profile_top.txt')
+    with open(top_path, 'w') as file:
+        file.write(table.getvalue())
+    written.append(top_path)
+
+    if collapsed:
+        collapsed_path = os.path.join(output_path, 'inspector_profile.collapsed')
+        with open(collapsed_path, 'w') as file:
+            file.write('\n'.join(collapsed_stacks(stats)) + '\n')
+        written.append(collapsed_path)
+
+    return written
+
+
 def main():
     """!
     @brief Main function to parse command-line arguments to run the Inspector.
@@ -38,6 +170,19 @@ def main():
     @arg -j, --json_path: Path for saving JSON reports. Default is 0.
     @arg -l, --light: Enable light mode. Default is False.
     @arg -x, --excel_path: Path for saving Excel reports.
+    @arg -w, --workers: Number of processes used to check the recording folders. Default is 1.
+    @arg -b, --batch: Treat the folder path as the top-level root and inspect all of its session folders.
+    @arg -s, --excel_streaming: Write the Excel report with the streaming (write-only) backend, for very large reports.
+    @arg -i, --incremental: Reuse the stored results of the recording folders unchanged since the last run.
+    @arg -o, --only: Names of the checks to run (e.g. NumberOfFramesCheck RawSizeCheck). Default is all the checks.
+    @arg -t, --check_threads: Number of threads running the checks of one recorded file. Default is 1.
+    @arg -p, --prefetch: Number of recording folders read ahead while the current one is checked (single process only). Default is 0.
+    @arg -c, --timing_csv: Write the stage timings and the resource usage of every check to 'timing.csv' next to the JSON reports (requires -j).
+    @arg -r, --report_format: Format of the JSON reports: 'pretty' (indented), 'compact' or 'jsonl' (one record per check). Default is pretty.
+    @arg --results_path: Folder receiving the flattened results of every check (Parquet with pyarrow, 'results.csv.gz' otherwise).
+    @arg --profile: Profile the run with cProfile and save the profile next to the JSON reports (worker processes are not profiled).
+    @arg --profile_top: Number of functions in the table of the slowest functions. Default is 30.
+    @arg --profile_collapsed: With --profile, also write flamegraph-compatible collapsed stacks.
 
     @note
     The function initializes an Inspector object with the provided parameters and executes the 'run' method.
@@ -51,16 +196,63 @@ def main():
         parser.add_argument('-j', '--json_path', type=str, required=False, help='path for json file', default=0)
         parser.add_argument('-l', '--light', required=False, help='enable light mode', default=False)
         parser.add_argument('-x', '--excel_path', type=str, required=True, help='input folder ', default='')
+        parser.add_argument('-w', '--workers', type=int, required=False, help='number of worker processes', default=1)
+        parser.add_argument('-b', '--batch', action='store_true', help='inspect every session folder of the input folder')
+        parser.add_argument('-s', '--excel_streaming', action='store_true', help='stream the excel report to keep memory flat')
+        parser.add_argument('-i', '--incremental', action='store_true', help='skip the folders unchanged since the last run')
+        parser.add_argument('-o', '--only', nargs='+', required=False, help='names of the checks to run', default=None)
+        parser.add_argument('-t', '--check_threads', type=int, required=False, help='number of threads per recorded file', default=1)
+        parser.add_argument('-p', '--prefetch', type=int, required=False, help='number of folders read ahead', default=0)
+        parser.add_argument('-c', '--timing_csv', action='store_true', help='write the timings of the run to timing.csv')
+        parser.add_argument('-r', '--report_format', choices=ReportGenerator.REPORT_FORMATS, required=False, help='format of the json reports', default='pretty')
+        parser.add_argument('--results_path', type=str, required=False, help='folder for the columnar export of the check results', default=None)
+        parser.add_argument('--profile', action='store_true', help='profile the run with cProfile')
+        parser.add_argument('--profile_top', type=int, required=False, help='number of functions in the profile table', default=30)
+        parser.add_argument('--profile_collapsed', action='store_true', help='also write collapsed stacks for flamegraphs')
 
         args = parser.parse_args()
+        if args.timing_csv and not args.json_path:
+            parser.error('-c/--timing_csv writes timing.csv next to the JSON reports and requires -j/--json_path')
         folder_path = args.folder_path
         enable_report = True if args.enable_report.lower() == 'true' else False
         json_path = args.json_path
         light_mode = True if args.light.lower() == 'true' else False
         excel_path = args.excel_path
+        workers = args.workers
+        excel_streaming = args.excel_streaming
+        incremental = args.incremental
+        only = args.only
+        check_threads = args.check_threads
+        prefetch = args.prefetch
+        timing_csv = args.timing_csv
+        report_format = args.report_format
+        results_exporter = ResultsExporter(args.results_path) if args.results_path else None
+        if only:
+            try:
+                CheckScheduler(only)
+            except ValueError as error:
+                exit(error)
 
-        inspector = Inspector(root_path=folder_path, enable_report=enable_report, json_path=json_path, light_mode=light_mode, excel_path=excel_path)
-        inspector.run()
+        profiler = cProfile.Profile() if args.profile else None
+        if profiler:
+            profiler.enable()
+        try:
+            if args.batch:
+                run_batch(folder_path, enable_report, json_path, light_mode, excel_path, workers, excel_streaming, incremental, only, check_threads, prefetch, timing_csv, report_format, results_exporter)
+            else:
+                inspector = Inspector(root_path=folder_path, enable_report=enable_report, json_path=json_path, light_mode=light_mode, excel_path=excel_path, workers=workers, excel_streaming=excel_streaming, incremental=incremental, only=only, check_threads=check_threads, prefetch=prefetch,
+                                      timing_csv=os.path.join(json_path, 'timing.csv') if timing_csv else None,
+                                      report_format=report_format, results_exporter=results_exporter)
+                inspector.run()
+        finally:
+            if results_exporter:
+                results_exporter.close()
+            # The profile of an interrupted run is saved as well
+            if profiler:
+                profiler.disable()
+                profile_path = json_path if json_path else os.path.dirname(os.path.abspath(excel_path))
+                for written_path in save_profile(profiler, profile_path, args.profile_top, args.profile_collapsed):
+                    print(f"#[Info]: Profile saved: {written_path}")
 
     except ImportError as error:
         exit(error)
@@ -0,0 +1,21 @@
+"""!
+@file
+
+@brief Performance benchmarks of the Inspector.
+
+This package generates synthetic recording sessions (`synthetic_session`) and times the
+data loading, every check, the `Checker`, the `Inspector` and the Excel report on them
+(`run_benchmark`). The results are written as JSON so that runs can be compared over time.
+
+Usage, from the root of the project:
+
+    python3 -m benchmark.run_benchmark --sessions 4 --frames 900 --output bench.json
+
+@package benchmark
+"""
+## @defgroup benchmark benchmark
+#@{
+
+from benchmark.synthetic_session import SENSOR_LAYOUTS, DEFECTS, generate_session, generate_recording
+
+# @} ##
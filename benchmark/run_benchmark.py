@@ -0,0 +1,429 @@
+"""!
+@file
+
+@brief Times the stages of the Inspector on synthetic recordings and writes the results as JSON.
+
+Measured stages:
+- `data_manager`: `DataManager.read` of each sensor folder, lazy (basenames only) and eager (every file loaded).
+- `checks`: `Check.run` of every registered check, per recorded file, on already loaded data.
+- `long_file`: The timestamp checks on one recorded file of 100k frames, built in memory, against the former per-line loops.
+- `checker`: `Checker.run` of each session folder.
+- `inspector`: `Inspector.run` of the whole recording, JSON and Excel reports included.
+- `excel`: Each phase of the Excel report, for the in-memory and the streaming backends.
+- `excel_design`: `ExcelGenerator.design_excel` on a workbook of many sheets (500 by default), against the former per-cell styling.
+
+@package benchmark.run_benchmark
+"""
+## @defgroup run_benchmark run_benchmark.py
+#@{
+
+try:
+    import argparse
+    import contextlib
+    import io
+    import json
+    import os
+    import platform
+    import shutil
+    import sys
+    import tempfile
+    import time
+    import numpy as np
+    from openpyxl.styles import Alignment, Border, PatternFill, Side
+except ImportError as e:
+    print(f"Error: {e}")
+    exit(1)
+
+# The modules of the Inspector live in the root of the project
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import check_levels
+from check_levels import Checker, CheckScheduler, DataManager, SensorDataCache
+from excel_generator import ExcelGenerator, StreamingExcelGenerator
+from inspector import Inspector
+from benchmark.synthetic_session import generate_recording
+
+
+def summarize(durations: list) -> dict:
+    """!
+    @brief Statistics of a list of durations in seconds.
+    """
+    return {
+        'runs': len(durations),
+        'total_s': float(np.sum(durations)) if durations else 0.0,
+        'mean_s': float(np.mean(durations)) if durations else 0.0,
+        'min_s': float(np.min(durations)) if durations else 0.0,
+        'max_s': float(np.max(durations)) if durations else 0.0,
+    }
+
+
+def timed(function, *args, **kwargs):
+    """!
+    @brief Calls a function and returns its result and duration in seconds.
+    """
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def session_paths(recording_path: str) -> list:
+    return [os.path.join(recording_path, name) for name in sorted(os.listdir(recording_path)) if name.isdigit() and len(name) == 6]
+
+
+def bench_data_manager(recording_path: str, repeat: int) -> dict:
+    """!
+    @brief Times DataManager.read on every sensor folder of the recording.
+    """
+    lazy, eager = [], []
+    for _ in range(repeat):
+        for session_path in session_paths(recording_path):
+            for sensor_name in sorted(os.listdir(session_path)):
+                sensor_path = os.path.join(session_path, sensor_name)
+                lazy.append(timed(DataManager(sensor_path).read)[1])
+                eager.append(timed(DataManager(sensor_path, lazy=False).read)[1])
+    return {'lazy_read': summarize(lazy), 'eager_read': summarize(eager)}
+
+
+def bench_checks(recording_path: str, repeat: int, only=None) -> dict:
+    """!
+    @brief Times the run of every planned check, each on already loaded data.
+
+    The timestamp profile shared by the frame checks is dropped before each file check,
+    so every check is timed as if it ran alone.
+    """
+    durations = {}
+    for _ in range(repeat):
+        for session_path in session_paths(recording_path):
+            data_cache = SensorDataCache()
+            plan = CheckScheduler(only).plan(data_cache.snapshot(session_path).names)
+
+            for check_class in plan.root_checks:
+                check = check_class.create({}, session_path, data_cache=data_cache)
+                durations.setdefault(check_class.__name__, []).append(timed(check.run)[1])
+
+            for sensor_plan in plan.sensor_plans:
+                sensor_path = os.path.join(session_path, sensor_plan.sensor_name)
+                sensor_data = data_cache.get(sensor_path) or {}
+                for file_data in sensor_data.values():
+                    file_data.load()
+                for sibling_name in sensor_plan.sibling_sensors:
+                    for file_data in (data_cache.get(os.path.join(session_path, sibling_name)) or {}).values():
+                        file_data.load()
+
+                for check_class in sensor_plan.folder_checks:
+                    check = check_class.create(sensor_data, sensor_path, data_cache=data_cache)
+                    durations.setdefault(check_class.__name__, []).append(timed(check.run)[1])
+
+                for file_name in sensor_data:
+                    for check_class in sensor_plan.file_checks:
+                        sensor_data[file_name]['profile'] = None
+                        check = check_class.create(sensor_data, sensor_path, file_name, data_cache)
+                        durations.setdefault(check_class.__name__, []).append(timed(check.run)[1])
+
+    return {name: summarize(values) for name, values in durations.items()}
+
+
+def reference_abnormal_frame_durations(txt_data, framerate: int) -> list:
+    """!
+    @brief Abnormal frame durations computed with the per-line loops of the former AbnormalFrameDurationCheck.run.
+    """
+    timestamps = []
+    abn_frms_drt = []
+    for x in range(0, (np.shape(txt_data))[0] - 1):
+        timestamps.append(txt_data[x + 1][0] - txt_data[x][0])
+
+    configured_frm_duration = (1 / framerate) * 1000
+    duration_difference_threshold = (configured_frm_duration / 2)
+
+    for frm_drt in timestamps:
+        if abs(frm_drt - configured_frm_duration) > duration_difference_threshold:
+            abn_frms_drt.append(frm_drt)
+    return abn_frms_drt
+
+
+def reference_growing_monotonically(txt_data) -> bool:
+    """!
+    @brief Result of the former GrowingMonotonicallyCheck.run (list comprehension and generator `all()`).
+    """
+    recorded_frame_num = (np.shape(txt_data))[0]
+    timestamps = [txt_data[x + 1][0] - txt_data[x][0] for x in range(0, recorded_frame_num - 1)]
+    return not all(timestamps[i] <= timestamps[i + 1] for i in range(len(timestamps) - 1))
+
+
+def bench_long_file(repeat: int, num_frames: int = 100_000, seed: int = 0) -> dict:
+    """!
+    @brief Times the timestamp checks on one long recorded file.
+
+    The '.txt' data of a 30 fps file is generated in memory, with 1 ms of jitter and 1% of dropped
+    frames, so the frame duration checks are timed without any file access. The abnormal frame duration
+    and monotonicity checks are also timed against the former per-line loops, which must give the same
+    results; 'speedup' is the ratio of their mean durations.
+    """
+    rng = np.random.default_rng(seed)
+    durations = 33 + rng.integers(-1, 2, size=num_frames)
+    durations[rng.choice(num_frames, size=num_frames // 100, replace=False)] += 66
+    timestamps = 1_000_000 + np.cumsum(durations)
+    txt_data = np.column_stack((timestamps, np.full(num_frames, 184320))).astype(np.int64)
+    meta_data = {'duration': f'{num_frames // 30}s', 'framerate': '30'}
+
+    references = {
+        'AbnormalFrameDurationCheck': (lambda: reference_abnormal_frame_durations(txt_data, 30),
+                                       lambda check: check.abn_frms_drt.tolist()),
+        'GrowingMonotonicallyCheck': (lambda: reference_growing_monotonically(txt_data),
+                                      lambda check: check.result),
+    }
+
+    results = {'frames': num_frames}
+    check_classes = (check_levels.NumberOfFramesCheck, check_levels.VRecordDurationCheck,
+                     check_levels.AbnormalFrameDurationCheck, check_levels.GrowingMonotonicallyCheck)
+    for check_class in check_classes:
+        check_durations = []
+        for _ in range(repeat):
+            # Each check computes its own timestamp profile
+            check = check_class({'txt': txt_data, 'meta': meta_data, 'profile': None}, '')
+            check_durations.append(timed(check.run)[1])
+        results[check_class.__name__] = summarize(check_durations)
+
+        if check_class.__name__ not in references:
+            continue
+        reference, check_value = references[check_class.__name__]
+        reference_durations = []
+        for _ in range(repeat):
+            reference_value, duration = timed(reference)
+            reference_durations.append(duration)
+        if reference_value != check_value(check):
+            raise AssertionError(f'{check_class.__name__} differs from the per-line reference')
+        results[check_class.__name__] = {'vectorized': results[check_class.__name__],
+                                         'per_line_reference': summarize(reference_durations),
+                                         'speedup': float(np.mean(reference_durations) / np.mean(check_durations))}
+    return results
+
+
+def bench_checker(recording_path: str, repeat: int, light_mode: bool, only=None) -> tuple:
+    """!
+    @brief Times Checker.run on every session folder.
+
+    @return The timings and the Excel reports of the sessions, reused by the Excel benchmark.
+    """
+    durations = []
+    excel_reports = {}
+    for _ in range(repeat):
+        for session_path in session_paths(recording_path):
+            (_, _, excel_report), duration = timed(Checker(session_path, light_mode, only).run)
+            durations.append(duration)
+            excel_reports[os.path.basename(session_path)] = excel_report
+    return summarize(durations), excel_reports
+
+
+def bench_excel(excel_reports: dict, output_path: str, repeat: int) -> dict:
+    """!
+    @brief Times each phase of the Excel report for both backends.
+    """
+    results = {}
+    for backend_name, backend in (('in_memory', ExcelGenerator), ('streaming', StreamingExcelGenerator)):
+        phases = {'run': [], 'rearrange_critical_rows': [], 'design_excel': [], 'create_summary_sheet': [], 'save': [], 'total': []}
+        for number in range(repeat):
+            excel_path = os.path.join(output_path, f'{backend_name}_{number}', 'excel_report')
+            generator = backend(excel_path)
+            start = time.perf_counter()
+            phases['run'].append(sum(timed(generator.run, report, name)[1] for name, report in excel_reports.items()))
+            for phase in ('rearrange_critical_rows', 'design_excel', 'create_summary_sheet', 'save'):
+                phases[phase].append(timed(getattr(generator, phase))[1])
+            phases['total'].append(time.perf_counter() - start)
+        results[backend_name] = {phase: summarize(values) for phase, values in phases.items()}
+    return results
+
+
+class PerCellStylingExcelGenerator(ExcelGenerator):
+    """!
+    @brief ExcelGenerator styling the cells like the former `design_excel`, as the reference of the styling benchmark.
+
+    Every styled cell gets new `PatternFill`, `Border` and `Alignment` objects, and the row height is set for each cell.
+    """
+
+    def style_cells(self, sheet):
+        cells_heights = 30
+        border_style = Side(style='medium', color='000000')
+        border_style2 = Side(style='thin', color='000000')
+
+        for row in sheet.iter_rows():
+            for cell in row:
+                if cell.value == False:
+                    cell.fill = PatternFill(start_color="FF7F7F", end_color="FF7F7F", fill_type='solid')
+                    row[1].fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type='solid')
+                    cell.border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
+                    sheet.row_dimensions[cell.row].height = cells_heights
+                    cell.alignment = Alignment(horizontal='center', vertical='center')
+                elif cell.value == True:
+                    cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type='solid')
+                    cell.border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
+                    sheet.row_dimensions[cell.row].height = cells_heights
+                    cell.alignment = Alignment(horizontal='center', vertical='center')
+                elif cell.value is not None and cell.value != "":
+                    cell.fill = PatternFill(start_color="FFE87C", end_color="FFFF00", fill_type='solid')
+                    cell.border = Border(left=border_style2, right=border_style2, top=border_style2, bottom=border_style2)
+                    cell.alignment = Alignment(horizontal='center', vertical='center')
+                    sheet.row_dimensions[cell.row].height = cells_heights
+
+        sheet['B1'] = 'Name of the Sensors  -> '
+        sheet['B1'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type='solid')
+        sheet['B1'].border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
+        sheet['B1'].alignment = Alignment(horizontal='center', vertical='center')
+
+        sheet['A2'] = 'Level of Checks'
+        sheet['A2'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type='solid')
+        sheet['A2'].border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
+        sheet['A2'].alignment = Alignment(horizontal='center', vertical='center')
+
+
+def cell_appearance(sheet) -> list:
+    """!
+    @brief Value, fill colors, border and alignment of every cell of a sheet, and the row heights.
+    """
+    cells = [(cell.coordinate, cell.value, cell.fill.fill_type, cell.fill.start_color.rgb, cell.fill.end_color.rgb,
+              cell.border.left.style, cell.alignment.horizontal, cell.alignment.vertical)
+             for row in sheet.iter_rows() for cell in row]
+    heights = [(row, sheet.row_dimensions[row].height) for row in range(1, sheet.max_row + 1)]
+    return cells + heights
+
+
+def bench_design_excel(excel_reports: dict, output_path: str, repeat: int, num_sheets: int = 500) -> dict:
+    """!
+    @brief Times the styling of an in-memory workbook of many report sheets.
+
+    The Excel reports of the sessions are repeated until the workbook holds `num_sheets` sheets. The named
+    styles are timed against the former per-cell styling (`PerCellStylingExcelGenerator`), whose sheets must
+    look the same; 'speedup' is the ratio of their mean durations.
+    """
+    reports = list(excel_reports.values())
+    results = {'sheets': num_sheets}
+    workbooks = {}
+    for name, backend in (('design_excel', ExcelGenerator), ('per_cell_reference', PerCellStylingExcelGenerator)):
+        durations = []
+        for number in range(repeat):
+            generator = backend(os.path.join(output_path, f'{name}_{number}', 'excel_report'))
+            for index in range(num_sheets):
+                generator.run(reports[index % len(reports)], f'{index:06d}')
+            generator.rearrange_critical_rows()
+            durations.append(timed(generator.design_excel)[1])
+        results[name] = summarize(durations)
+        workbooks[name] = generator.create_or_load_workbook()
+
+    for sheet_name in workbooks['design_excel'].sheetnames[:len(reports)]:
+        if cell_appearance(workbooks['design_excel'][sheet_name]) != cell_appearance(workbooks['per_cell_reference'][sheet_name]):
+            raise AssertionError(f'The named styles of sheet {sheet_name} differ from the per-cell reference')
+    results['speedup'] = results['per_cell_reference']['mean_s'] / results['design_excel']['mean_s']
+    return results
+
+
+def bench_inspector(recording_path: str, output_path: str, repeat: int, light_mode: bool, workers: int, only=None) -> dict:
+    """!
+    @brief Times Inspector.run on the whole recording, reports included.
+    """
+    durations = []
+    for number in range(repeat):
+        inspector = Inspector(root_path=recording_path, enable_report='true',
+                              json_path=os.path.join(output_path, f'inspector_{number}', 'json_report'), light_mode=light_mode,
+                              excel_path=os.path.join(output_path, f'inspector_{number}', 'excel_report'), workers=workers, only=only)
+        # The progress bar and the summary of the Inspector are not part of the results
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            durations.append(timed(inspector.run)[1])
+    return summarize(durations)
+
+
+def run_benchmark(recording_path: str, output_path: str, repeat: int = 3, light_mode: bool = False, workers: int = 1, only=None,
+                  excel_sheets: int = 500) -> dict:
+    """!
+    @brief Runs every benchmark on a recording folder.
+
+    @param recording_path (str): Recording folder holding the 6-digit session folders.
+    @param output_path (str): Folder receiving the reports written during the benchmark.
+    @param repeat (int): Number of times each benchmark is repeated.
+    @param light_mode (bool): Light mode of the Checker and the Inspector.
+    @param workers (int): Worker processes of the Inspector.
+    @param only (list): Names of the checks to run, all the registered checks if None.
+    @param excel_sheets (int): Number of sheets of the styling benchmark, 0 to skip it.
+    @return Dictionary of the results.
+    """
+    results = {}
+    results['data_manager'] = bench_data_manager(recording_path, repeat)
+    results['checks'] = bench_checks(recording_path, repeat, only)
+    results['long_file'] = bench_long_file(repeat)
+    results['checker'], excel_reports = bench_checker(recording_path, repeat, light_mode, only)
+    results['excel'] = bench_excel(excel_reports, output_path, repeat)
+    if excel_sheets:
+        results['excel_design'] = bench_design_excel(excel_reports, output_path, repeat, excel_sheets)
+    results['inspector'] = bench_inspector(recording_path, output_path, repeat, light_mode, workers, only)
+    return results
+
+
+def main():
+    """!
+    @brief Generates a synthetic recording, benchmarks it and writes the JSON results.
+
+    @arg -n, --sessions: Number of synthetic session folders. Default is 2.
+    @arg -f, --frames: Frames of a recorded file at 30 fps. Default is 900.
+    @arg -c, --files: Recorded files per sensor folder. Default is 2.
+    @arg -d, --defect_rate: Fraction of the recorded files with an injected defect. Default is 0.2.
+    @arg -r, --repeat: Repetitions of each benchmark. Default is 3.
+    @arg -w, --workers: Worker processes of the Inspector benchmark. Default is 1.
+    @arg -p, --data_path: Existing recording folder to benchmark instead of a synthetic one.
+    @arg -o, --output: JSON file receiving the results. Default is the standard output.
+    @arg --excel_sheets: Sheets of the workbook styled by the `excel_design` benchmark, 0 to skip it. Default is 500.
+    @arg --timestamp_cache: Enable the binary timestamp cache, to time the cached runs instead of the parsing.
+    """
+    parser = argparse.ArgumentParser(description='Benchmark the Inspector on synthetic recordings')
+    parser.add_argument('-n', '--sessions', type=int, default=2, help='number of session folders')
+    parser.add_argument('-f', '--frames', type=int, default=900, help='frames per recorded file at 30 fps')
+    parser.add_argument('-c', '--files', type=int, default=2, help='recorded files per sensor folder')
+    parser.add_argument('-d', '--defect_rate', type=float, default=0.2, help='fraction of recorded files with a defect')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='repetitions of each benchmark')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='worker processes of the Inspector')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='seed of the synthetic content')
+    parser.add_argument('-l', '--light', action='store_true', help='enable light mode')
+    parser.add_argument('-o', '--output', type=str, default=None, help='JSON file receiving the results')
+    parser.add_argument('-p', '--data_path', type=str, default=None, help='existing recording folder to benchmark')
+    parser.add_argument('--excel_sheets', type=int, default=500, help='sheets of the styling benchmark, 0 to skip it')
+    parser.add_argument('--timestamp_cache', action='store_true', help='enable the binary timestamp cache')
+    args = parser.parse_args()
+
+    check_levels.timestamp_cache = check_levels.TimestampCache(enabled=args.timestamp_cache)
+    work_path = tempfile.mkdtemp(prefix='inspector_benchmark_')
+    try:
+        if args.data_path:
+            recording_path = os.path.abspath(args.data_path)
+            injected = None
+        else:
+            recording_path = os.path.join(work_path, '0001')
+            injected, generation_time = timed(generate_recording, recording_path, num_sessions=args.sessions, num_frames=args.frames,
+                                              num_files=args.files, defect_rate=args.defect_rate, seed=args.seed)
+
+        results = {
+            'environment': {
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            },
+            'parameters': vars(args),
+            'injected_defects': injected,
+            'results': run_benchmark(recording_path, os.path.join(work_path, 'reports'), args.repeat, args.light, args.workers,
+                                     excel_sheets=args.excel_sheets),
+        }
+        if injected is not None:
+            results['parameters']['generation_s'] = generation_time
+    finally:
+        shutil.rmtree(work_path, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
+
+# @} ##
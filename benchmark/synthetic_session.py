@@ -0,0 +1,143 @@
+"""!
+@file
+
+@brief Generator of synthetic recording sessions for the benchmarks.
+
+A recording ('0001') holds 6-digit session folders ('105900', '105901', ...), each with the
+kinect, flexx2 and lepton sensor folders. Every sensor folder contains numbered recorded files
+('00000000.meta', '00000000.txt', '00000000.rawv', ...) in the layout written by the recorder,
+with random pixel content. Defects can be injected in a chosen fraction of the recorded files.
+
+@package benchmark.synthetic_session
+"""
+## @defgroup synthetic_session synthetic_session.py
+#@{
+
+try:
+    import os
+    import random
+    import zlib
+    import numpy as np
+except ImportError as e:
+    print(f"Error: {e}")
+    exit(1)
+
+
+## Frame rate, frame width, frame height and bytes per pixel of each sensor folder
+SENSOR_LAYOUTS = {
+    'depth.kinect': {'framerate': 30, 'width': 320, 'height': 288, 'bytes_per_pixel': 2},
+    'ir.kinect': {'framerate': 30, 'width': 320, 'height': 288, 'bytes_per_pixel': 2},
+    'depth.flexx2': {'framerate': 5, 'width': 224, 'height': 172, 'bytes_per_pixel': 2},
+    'ir.flexx2': {'framerate': 5, 'width': 224, 'height': 172, 'bytes_per_pixel': 2},
+    'thermal.lepton': {'framerate': 9, 'width': 160, 'height': 120, 'bytes_per_pixel': 2},
+}
+
+## Defects that can be injected in a recorded file
+DEFECTS = (
+    'dropped_frames',       # Gaps in the timestamps
+    'non_monotonic',        # A timestamp going back in time
+    'frozen_frames',        # Identical consecutive frames
+    'black_frames',         # Frames with every pixel at zero
+    'truncated_raw',        # Raw file shorter than the frame sizes of the '.txt' file
+    'unexpected_file',      # Extra file in the sensor folder
+)
+
+
+def _write_recorded_file(sensor_path: str, index: int, num_files: int, layout: dict, num_frames: int, defects: set, rng, timestamp_seed):
+
+    # Write the '.meta', '.txt' and '.rawv' files of one recorded file.
+    # The ir and depth folders of a device get the same timestamp_seed, hence the same timestamps.
+
+    basename = f'{index:08d}'
+    framerate = layout['framerate']
+    frame_bytes = layout['width'] * layout['height'] * layout['bytes_per_pixel']
+    frame_duration = 1000 // framerate
+
+    with open(os.path.join(sensor_path, f'{basename}.meta'), 'w') as file:
+        file.write(f"duration {max(1, num_frames // framerate)}s\n")
+        file.write(f"framerate {framerate}\n")
+        file.write(f"file {index + 1}/{num_files}\n")
+        file.write(f"width {layout['width']}\n")
+        file.write(f"height {layout['height']}\n")
+
+    # Real recorders show a jitter of about one millisecond on the frame durations
+    durations = frame_duration + np.random.default_rng(timestamp_seed).integers(-1, 2, size=num_frames)
+    durations[0] = 0
+    if 'dropped_frames' in defects and num_frames > 10:
+        gaps = rng.choice(np.arange(1, num_frames), size=max(1, num_frames // 5), replace=False)
+        durations[gaps] += 3 * frame_duration
+    if 'non_monotonic' in defects and num_frames > 2:
+        durations[num_frames // 2] = -frame_duration
+    timestamps = 1_000_000 + index * num_frames * frame_duration + np.cumsum(durations)
+
+    with open(os.path.join(sensor_path, f'{basename}.txt'), 'w') as file:
+        file.write(''.join(f"{timestamp} {frame_bytes}\n" for timestamp in timestamps.tolist()))
+
+    frames = rng.integers(0, 256, size=(num_frames, frame_bytes), dtype=np.uint8)
+    if 'frozen_frames' in defects and num_frames > 10:
+        start = num_frames // 3
+        frames[start + 1:start + 6] = frames[start]
+    if 'black_frames' in defects and num_frames > 10:
+        start = 2 * num_frames // 3
+        frames[start:start + 3] = 0
+    if 'truncated_raw' in defects:
+        frames = frames[:max(1, num_frames // 2)]
+    frames.tofile(os.path.join(sensor_path, f'{basename}.rawv'))
+
+
+def generate_session(session_path: str, num_frames: int = 300, num_files: int = 2, defect_rate: float = 0.0,
+                     sensors=None, seed: int = 0) -> list:
+    """!
+    @brief Writes one synthetic 6-digit session folder.
+
+    @param session_path (str): Path of the session folder to create.
+    @param num_frames (int): Number of frames of a recorded file at 30 fps; slower sensors get proportionally fewer.
+    @param num_files (int): Number of recorded files in each sensor folder.
+    @param defect_rate (float): Fraction of the recorded files that get one random defect.
+    @param sensors (list): Names of the sensor folders to write, all the SENSOR_LAYOUTS if None.
+    @param seed (int): Seed of the random content and defects.
+    @return List of (sensor folder, basename, defect) of the injected defects.
+    """
+    rng = np.random.default_rng(seed)
+    chooser = random.Random(seed)
+    injected = []
+
+    for sensor_name in sensors or SENSOR_LAYOUTS:
+        layout = SENSOR_LAYOUTS[sensor_name]
+        sensor_path = os.path.join(session_path, sensor_name)
+        os.makedirs(sensor_path, exist_ok=True)
+        sensor_frames = max(2, num_frames * layout['framerate'] // 30)
+
+        for index in range(num_files):
+            defects = set()
+            if chooser.random() < defect_rate:
+                defect = chooser.choice(DEFECTS)
+                defects.add(defect)
+                injected.append((sensor_name, f'{index:08d}', defect))
+            timestamp_seed = (seed, zlib.crc32(sensor_name.split('.')[-1].encode()), index)
+            _write_recorded_file(sensor_path, index, num_files, layout, sensor_frames, defects, rng, timestamp_seed)
+            if 'unexpected_file' in defects:
+                with open(os.path.join(sensor_path, f'{index:08d}.log'), 'w') as file:
+                    file.write('unexpected\n')
+
+    return injected
+
+
+def generate_recording(recording_path: str, num_sessions: int = 2, first_session: int = 105900, **session_options) -> dict:
+    """!
+    @brief Writes a recording folder with several synthetic session folders.
+
+    @param recording_path (str): Path of the recording folder (its name should be numeric, e.g. '0001').
+    @param num_sessions (int): Number of 6-digit session folders.
+    @param first_session (int): Name of the first session folder.
+    @param session_options: Options passed to `generate_session`.
+    @return Dictionary with the session folder names as keys and their injected defects as values.
+    """
+    seed = session_options.pop('seed', 0)
+    injected = {}
+    for number in range(num_sessions):
+        name = f'{first_session + number:06d}'
+        injected[name] = generate_session(os.path.join(recording_path, name), seed=seed + number, **session_options)
+    return injected
+
+# @} ##
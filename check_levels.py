@@ -18,34 +18,234 @@ Utility functions are defined to assist package operations.
 
 try:
     from typing import Any
+    from collections import OrderedDict
+    from concurrent.futures import ThreadPoolExecutor
     import numpy as np
     import os
     import json
     import re
+    import threading
+    import hashlib
+    import tempfile
+    import time
+    import zlib
 
 except ImportError as e:
     print(f"Error: {e}")
     exit(1)
 
+# Optional faster hash for the frame content checks
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Peak memory of the process, not available on every platform
+try:
+    import resource
+except ImportError:
+    resource = None
 
-def get_folder_and_file_sizes(root_folder: str) -> dict:
+
+def get_folder_and_file_sizes(root_folder: str, scan=None) -> dict:
     """!
     @brief Retrieve sizes of folders and files in the specified root folder.
 
     @param root_folder: Path to the root folder.
+    @param scan: Function returning the FolderSnapshot of a path, e.g. SensorDataCache.snapshot.
     @return folder_sizes: Dictionary with folder/file names as keys and their sizes as values.
     """
+    if scan is None:
+        scan = FolderSnapshot
 
+    root = scan(root_folder)
     folder_or_files_sizes = {}
-    for item in os.listdir(root_folder):
-        item_path = os.path.join(root_folder, item)
-        if os.path.isdir(item_path):                # Checking if our item is directory or not
-            folder_or_files_sizes[item] = sum(os.path.getsize(os.path.join(item_path, f)) for f in os.listdir(item_path))
+    for item in root.names:
+        if item in root.folders:                    # Checking if our item is directory or not
+            folder_or_files_sizes[item] = sum(scan(os.path.join(root_folder, item)).sizes.values())
         else:                                       # It means our item is a file
-            folder_or_files_sizes[item] = os.path.getsize(item_path)
+            folder_or_files_sizes[item] = root.sizes[item]
     return folder_or_files_sizes
 
 
+class FolderSnapshot:
+    """!
+    @brief Names, sizes and types of the entries of a folder, read with a single os.scandir.
+
+    The folder and file checks of a sensor folder and its DataManager share one snapshot
+    instead of listing the folder and calling os.path.getsize for each file again.
+    """
+
+    def __init__(self, path: str):
+
+        # Scan the folder.
+        # param path: Path to the folder.
+
+        self.path = path
+        self.names = []         # Entry names, in the order of os.listdir
+        self.sizes = {}         # Size in bytes of each entry
+        self.mtimes = {}        # Modification time in nanoseconds of each entry
+        self.folders = set()    # Names of the sub-folders
+        with os.scandir(path) as entries:
+            for entry in entries:
+                stat = entry.stat()
+                self.names.append(entry.name)
+                self.sizes[entry.name] = stat.st_size
+                self.mtimes[entry.name] = stat.st_mtime_ns
+                if entry.is_dir():
+                    self.folders.add(entry.name)
+
+    def with_extension(self, *extensions) -> list:
+
+        # Names of the entries ending with one of the extensions (case-insensitive), e.g. '.txt'.
+
+        return [name for name in self.names if name.lower().endswith(extensions)]
+
+    def size(self, name: str) -> int:
+
+        # Size in bytes of an entry, None if the folder has no such entry.
+
+        return self.sizes.get(name)
+
+    def walk(self):
+
+        # Yield (name, size) of every file in the folder and its sub-folders, in os.walk order.
+
+        for name in self.names:
+            if name not in self.folders:
+                yield name, self.sizes[name]
+        for name in self.names:
+            if name in self.folders:
+                yield from FolderSnapshot(os.path.join(self.path, name)).walk()
+
+
+# Bytes read from the recorded files by the current thread
+_read_bytes = threading.local()
+
+
+def count_read_bytes(num_bytes: int):
+    """!
+    @brief Add bytes read from a recorded file (parsed or accessed through a memory map) to the current thread's counter.
+    """
+    _read_bytes.total = getattr(_read_bytes, 'total', 0) + int(num_bytes)
+
+
+def read_bytes_count() -> int:
+    """!
+    @brief Bytes read from the recorded files by the current thread so far.
+    """
+    return getattr(_read_bytes, 'total', 0)
+
+
+def peak_rss_kb():
+    """!
+    @brief Peak resident memory of the process in kilobytes, None where it is not available.
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def load_timestamp_file(file_path: str) -> np.ndarray:
+    """!
+    @brief Load a sensor '.txt' file into a contiguous int64 array.
+
+    Each line of the file holds space separated integer columns (timestamp, frame bytes).
+    The whole file is parsed in one NumPy call instead of splitting every line in Python.
+
+    @param file_path: Path to the '.txt' file.
+    @return txt_array: Array of shape (number of frames, number of columns).
+    """
+
+    with open(file_path, 'r') as file:
+        content = file.read()
+    count_read_bytes(len(content))
+
+    line_end = content.find('\n')
+    num_columns = len((content if line_end == -1 else content[:line_end]).split())
+    if num_columns == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    values = np.fromstring(content, dtype=np.int64, sep=' ')
+    if values.size % num_columns != 0:
+        raise ValueError(f"Inconsistent number of columns in {file_path}")
+
+    return np.ascontiguousarray(values.reshape(-1, num_columns))
+
+
+class RawFrameReader:
+    """!
+    @brief Zero-copy, frame-indexed access to a '.rawv' or '.rawa' file.
+
+    The raw file is memory-mapped and split into frames with the per-frame byte sizes
+    of the second column of the matching '.txt' file. Indexing returns a view on the
+    mapped file, so content checks can walk multi-GB captures without loading them.
+    """
+
+    def __init__(self, raw_path: str, txt_data: np.ndarray):
+
+        # Map a raw file.
+        # param raw_path: Path to the '.rawv' or '.rawa' file.
+        # param txt_data: Array parsed from the matching '.txt' file, frame sizes in the second column.
+
+        self.path = raw_path
+        self.file_size = os.path.getsize(raw_path)
+
+        frame_sizes = txt_data[:, 1] if txt_data.ndim == 2 and txt_data.shape[1] > 1 else np.empty(0, dtype=np.int64)
+        self.offsets = np.zeros(frame_sizes.size + 1, dtype=np.int64)
+        np.cumsum(frame_sizes, out=self.offsets[1:])
+
+        # Only the frames completely stored in the file are readable
+        self.frame_num = int(np.searchsorted(self.offsets, self.file_size, side='right')) - 1
+        self.memmap = np.memmap(raw_path, dtype=np.uint8, mode='r') if self.file_size else np.empty(0, dtype=np.uint8)
+
+    def __len__(self) -> int:
+        return self.frame_num
+
+    def __getitem__(self, index: int) -> np.ndarray:
+
+        # Return the bytes of one frame as a uint8 view on the file.
+
+        if index < 0:
+            index += self.frame_num
+        if not 0 <= index < self.frame_num:
+            raise IndexError(f"Frame {index} is not stored in {self.path}")
+        count_read_bytes(self.offsets[index + 1] - self.offsets[index])
+        return self.memmap[self.offsets[index]:self.offsets[index + 1]]
+
+    def frame(self, index: int, dtype=np.uint8, shape: tuple = None) -> np.ndarray:
+
+        # Return one frame reinterpreted as 'dtype' and optionally reshaped (e.g. to (height, width)).
+
+        frame = self[index]
+        frame = frame[:frame.size - frame.size % np.dtype(dtype).itemsize].view(dtype)
+        return frame.reshape(shape) if shape is not None else frame
+
+    def iter_frames(self, step: int = 1, dtype=np.uint8):
+
+        # Yield (index, frame) for every 'step'-th stored frame.
+
+        for index in range(0, self.frame_num, max(1, step)):
+            yield index, self.frame(index, dtype)
+
+    def iter_blocks(self, frames_per_block: int = 64, dtype=np.uint8):
+
+        # Yield (first index, block) where block is a 2D (frames, values) view of consecutive frames.
+        # Blocks are only built when all frames have the same size, otherwise one frame is yielded at a time.
+
+        frame_sizes = np.diff(self.offsets[:self.frame_num + 1])
+        if self.frame_num and np.all(frame_sizes == frame_sizes[0]) and frame_sizes[0] % np.dtype(dtype).itemsize == 0:
+            values_per_frame = int(frame_sizes[0]) // np.dtype(dtype).itemsize
+            data = self.memmap[:self.offsets[self.frame_num]].view(dtype).reshape(self.frame_num, values_per_frame)
+            for first_index in range(0, self.frame_num, max(1, frames_per_block)):
+                block = data[first_index:first_index + frames_per_block]
+                count_read_bytes(block.nbytes)
+                yield first_index, block
+        else:
+            for index, frame in self.iter_frames(dtype=dtype):
+                yield index, frame.reshape(1, -1)
+
+
 class SetConfigurationSetting:
     """!
     @brief Import the 'configure_settings.json' file containing settings for use in our Checkers.
@@ -75,10 +275,220 @@ class SetConfigurationSetting:
         
         return self.config_data['threshold'][checker_name]    
 
+    def get_setting(self, section: str, key: str, default=None):
+
+        # Return a value from a section of the configuration file.
+        # param section: The name of the section, e.g. 'data_cache'.
+        # param key: The name of the setting inside the section.
+        # param default: The value returned when the setting is missing.
+
+        return self.config_data.get(section, {}).get(key, default)
+
 # Import configuration file
 set_config = SetConfigurationSetting()
 set_config.read_config_data()   
 
+
+class TimestampCache:
+    """!
+    @brief Binary cache of the parsed '.txt' timestamp files.
+
+    The first parse of a '.txt' file is saved as a '.npy' file in the cache directory; later
+    runs memory-map it instead of parsing the text again. The name of a cache file contains
+    the size and modification time of its source, so an edited '.txt' file is parsed again.
+    When the directory grows over 'max_bytes', the least recently used files (outdated ones
+    first, as they are never read again) are removed.
+
+    The cache is disabled unless 'enabled' is set in 'configure_settings.json'.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = None, enabled: bool = None):
+
+        # Initialize the cache, missing parameters are read from 'configure_settings.json'.
+        # param directory: Cache directory, '<temp dir>/video_inspector_timestamps' if empty.
+        # param max_bytes: Size budget of the cache directory.
+        # param enabled: False to always parse the '.txt' files.
+
+        if enabled is None:
+            enabled = bool(set_config.get_setting('timestamp_cache', 'enabled', False))
+        if directory is None:
+            directory = set_config.get_setting('timestamp_cache', 'directory', '')
+        if max_bytes is None:
+            max_bytes = int(set_config.get_setting('timestamp_cache', 'max_size_mb', 1024)) * 1024 * 1024
+        self.enabled = enabled
+        self.directory = os.path.expanduser(directory) if directory else os.path.join(tempfile.gettempdir(), 'video_inspector_timestamps')
+        self.max_bytes = max_bytes
+        self.total_bytes = None     # Size of the cache directory, scanned on the first store
+
+    def _cache_prefix(self, file_path: str) -> str:
+
+        # Prefix shared by every cache file of a source file.
+
+        return hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+
+    def load(self, file_path: str, size: int = None, mtime_ns: int = None) -> np.ndarray:
+
+        # Return the parsed '.txt' file, memory-mapped from the cache when it is up to date.
+        # param file_path: Path to the '.txt' file.
+        # param size, mtime_ns: Stat of the file if already known (e.g. from a FolderSnapshot).
+        # return txt_array: Array of shape (number of frames, number of columns), read-only on a cache hit.
+
+        if not self.enabled:
+            return load_timestamp_file(file_path)
+
+        if size is None or mtime_ns is None:
+            stat = os.stat(file_path)
+            size, mtime_ns = stat.st_size, stat.st_mtime_ns
+        prefix = self._cache_prefix(file_path)
+        cache_path = os.path.join(self.directory, f'{prefix}_{size}_{mtime_ns}.npy')
+
+        try:
+            txt_array = np.load(cache_path, mmap_mode='r')
+            count_read_bytes(txt_array.nbytes)
+            os.utime(cache_path)    # Recently used files are evicted last
+            return txt_array
+        except (OSError, ValueError):
+            pass
+
+        txt_array = load_timestamp_file(file_path)
+        try:
+            self._store(prefix, cache_path, txt_array)
+        except OSError:
+            # A read-only or full cache directory only disables the cache
+            pass
+        return txt_array
+
+    def _store(self, prefix: str, cache_path: str, txt_array: np.ndarray):
+
+        # Write a cache file atomically and keep a running total of the directory size.
+        # The directory is only scanned again when the total goes over 'max_bytes'.
+
+        os.makedirs(self.directory, exist_ok=True)
+        if self.total_bytes is None:
+            self.total_bytes = sum(size for _, size, _ in self._scan())
+        tmp_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as file:
+            np.save(file, txt_array)
+        self.total_bytes += os.path.getsize(tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _scan(self) -> list:
+
+        # Return (last use, size, path) of every cache file.
+
+        entries = []
+        with os.scandir(self.directory) as scanned:
+            for entry in scanned:
+                if entry.name.endswith('.npy'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+
+        # Remove the least recently used cache files until the directory fits in 90% of 'max_bytes',
+        # so that the next stores do not scan the directory again right away.
+
+        entries = self._scan()
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= 0.9 * self.max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+        self.total_bytes = total_bytes
+
+
+# Created on first use, see get_timestamp_cache
+timestamp_cache = None
+
+
+def get_timestamp_cache() -> TimestampCache:
+    """!
+    @brief Return the TimestampCache of the process, created with the settings of 'configure_settings.json' on first use.
+    """
+
+    global timestamp_cache
+    if timestamp_cache is None:
+        timestamp_cache = TimestampCache()
+    return timestamp_cache
+
+
+class LazyFileData(dict):
+    """!
+    @brief Data of one recorded basename, read from disk the first time it is accessed.
+
+    The 'txt' timestamps, the 'meta' dictionary and the 'rawv'/'rawa' frame readers are
+    only loaded when a check first reads them, so checks that look at the folder content
+    or the metadata alone never parse the timestamp files.
+    """
+
+    LAZY_KEYS = ('txt', 'meta', 'rawv', 'rawa')
+
+    def __init__(self, loader, basename: str, on_load=None):
+
+        # Initialize the entries with empty placeholders.
+        # param loader: Function called as loader(basename, key) to read one entry.
+        # param basename: Basename of the recorded files.
+        # param on_load: Function called as on_load(key, value) after an entry is loaded or set, None to disable.
+
+        super().__init__(rawa=[], rawv=[], txt=[], meta=[], profile=None)
+        self.loader = loader
+        self.basename = basename
+        self.on_load = on_load
+        self.pending = set(self.LAZY_KEYS)
+        self.lock = threading.RLock()
+
+    def __getitem__(self, key):
+        if key in self.pending:
+            value = None
+            with self.lock:
+                if key in self.pending:
+                    value = self.loader(self.basename, key)
+                    dict.__setitem__(self, key, value)
+                    self.pending.discard(key)
+            # Reported outside the lock, the callback may take the lock of a cache
+            if value is not None and self.on_load is not None:
+                self.on_load(key, value)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self.pending.discard(key)
+        dict.__setitem__(self, key, value)
+        if self.on_load is not None:
+            self.on_load(key, value)
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def load(self):
+
+        # Read every entry that is still pending.
+
+        for key in self.LAZY_KEYS:
+            self[key]
+
+    def unload(self):
+
+        # Release the loaded entries, which are read again on the next access.
+
+        with self.lock:
+            for key in self.LAZY_KEYS:
+                dict.__setitem__(self, key, [])
+            dict.__setitem__(self, 'profile', None)
+            self.pending = set(self.LAZY_KEYS)
+
+
 class DataManager:
     """!
     @brief Class for importing data from a specified path.
@@ -87,16 +497,26 @@ class DataManager:
     and populate DataManager attributes. It also includes a method to prepare
     data for saving.
 
+    By default the files are read lazily: 'read' only identifies the recorded
+    basenames and each '.txt', '.meta' and '.raw*' file is loaded the first time
+    a check accesses it (see LazyFileData).
+
     @note Ensure that the necessary files (meta, txt, rawa, rawv) are present
           with corresponding basenames in the specified path.
     """
 
-    def __init__(self, path: str = "mypath"):
+    def __init__(self, path: str = "mypath", lazy: bool = True, snapshot: FolderSnapshot = None, on_load=None):
         
         # Initialize DataManager with a specified path and empty attributes.#
         #param path: Path to the data directory.
+        #param lazy: Load the files on first access instead of in 'read'.
+        #param snapshot: FolderSnapshot of the data directory, scanned in 'read' if None.
+        #param on_load: Function called as on_load(key, value) after each entry is loaded (see LazyFileData).
         
         self.path = path
+        self.lazy = lazy
+        self.snapshot = snapshot
+        self.on_load = on_load
         self.time = ''
         self.data = {}
         self.check_result = True
@@ -112,12 +532,16 @@ class DataManager:
         if not self._prepare_data_for_saving():
             data_managing_is_successful = False       
 
-        if not self._read_raw_data():
-            data_managing_is_successful = False
+        if self.lazy:
+            return data_managing_is_successful
 
+        # The raw files are indexed with the frame sizes of the '.txt' files
         if not self._read_txt_data():
             data_managing_is_successful = False
 
+        if not self._read_raw_data():
+            data_managing_is_successful = False
+
         if not self._read_metadata():
             data_managing_is_successful = False
 
@@ -129,14 +553,46 @@ class DataManager:
         #return: True if valid data sets are identified, False otherwise.
         #""
 
-        recorded_files = os.listdir(self.path)
+        if self.snapshot is None:
+            self.snapshot = FolderSnapshot(self.path)
+        recorded_files = set(self.snapshot.names)
         recorded_basename = {os.path.splitext(file)[0] for file in recorded_files}
 
         for basename in recorded_basename :
             if (f'{basename}.meta') in recorded_files and (f'{basename}.txt') in recorded_files and {(f'{basename}.rawv') in recorded_files or (f'{basename}.rawa') in recorded_files} :
-                self.data[basename] = {'rawa' : [], 'rawv' : [], 'txt' : [], 'meta' : []}
+                self.data[basename] = LazyFileData(self._load, basename, self.on_load)
 
         return bool(self.data)
+
+    def _load(self, basename: str, key: str):
+
+        # Read one entry of a recorded basename.
+        # param basename: Basename of the recorded files.
+        # param key: 'txt', 'meta', 'rawv' or 'rawa'.
+        # return: The loaded data, or an empty list for a missing raw file.
+
+        if key == 'txt':
+            name = f'{basename}.txt'
+            return get_timestamp_cache().load(os.path.join(self.path, name), self.snapshot.size(name), self.snapshot.mtimes.get(name))
+        if key == 'meta':
+            return self._load_metadata(basename)
+
+        raw_path = os.path.join(self.path, f'{basename}.{key}')
+        if f'{basename}.{key}' not in self.snapshot.sizes:
+            return []
+        # The raw files are indexed with the frame sizes of the '.txt' files
+        return RawFrameReader(raw_path, self.data[basename]['txt'])
+
+    def _load_metadata(self, basename: str) -> dict:
+
+        # Read the '<key> <value>' lines of a .meta file.
+
+        data = {}
+        with open(os.path.join(self.path, f'{basename}.meta'), "r") as file:
+            for line in file:
+                columns = line.strip().split(' ')
+                data[columns[0]] = columns[1]
+        return data
     
     def _read_raw_data(self) -> bool:
         #""!
@@ -146,13 +602,12 @@ class DataManager:
         #""
         ret = True
         for filename in self.data:
-                data = []
-                self.data[filename]['rawa'] = data
-                self.data[filename]['rawv'] = data
+            for extension in ('rawv', 'rawa'):
+                self.data[filename][extension]
+
+        if not self.data:
+            ret = False
 
-                if self.data[filename]['rawv'] == {} and self.data[filename]['rawa'] == {}:
-                    
-                    ret = False
         return ret
 
     def _read_txt_data(self) -> bool:
@@ -164,14 +619,7 @@ class DataManager:
 
         ret = True
         for filename in self.data:
-            data = []
-            with open(os.path.join(self.path, f'{filename}.txt'), "r") as file:
-                    for line in file:
-                        columns = line.strip().split(' ')
-                        row = [int(col) for col in columns]
-                        data.append(row)
-            file.close()
-            self.data[filename]['txt'] = data
+            self.data[filename]['txt']
 
         if not self.data:
             ret = False
@@ -186,13 +634,7 @@ class DataManager:
         #""
         ret = True
         for filename in self.data:
-                data = {}
-                with open(os.path.join(self.path, f'{filename}.meta'), "r") as file:
-                    for line in file:
-                        columns = line.strip().split(' ')
-                        data[columns[0]] = columns[1]
-                file.close()
-                self.data[filename]['meta'] = data
+            self.data[filename]['meta']
 
         if not self.data:
             ret = False
@@ -208,6 +650,345 @@ class DataManager:
         return self.data
 
 
+class SensorDataCache:
+    """!
+    @brief Recording-scoped cache of the data parsed from each sensor folder.
+
+    Every sensor folder is read by a DataManager only once; later requests for the
+    same folder (e.g. the ir.* folder needed by the IR/depth consistency checks)
+    return the already parsed data. The size of each entry is added to the cache when
+    it is loaded, and when 'max_bytes' is exceeded the least recently used folders are
+    unloaded on the next request. Memory-mapped arrays live in the page cache and
+    are not counted.
+    """
+
+    def __init__(self, max_bytes: int = None):
+
+        # Initialize an empty cache.
+        # param max_bytes: Memory budget for the cached data, read from 'configure_settings.json' if None.
+
+        if max_bytes is None:
+            max_bytes = int(set_config.get_setting('data_cache', 'max_size_mb', 512)) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        # Sensor folder path -> [data, size in bytes]
+        self.entries = OrderedDict()
+        self.snapshots = {}
+        self.lock = threading.RLock()
+        # Time spent and bytes read by 'prefetch', on the prefetching thread
+        self.prefetch_s = 0.0
+        self.prefetched_read_bytes = 0
+
+    @staticmethod
+    def _estimate_size(value) -> int:
+
+        # Approximate the memory used by one loaded entry of a recorded file.
+
+        if isinstance(value, np.memmap):
+            return 0
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, RawFrameReader):
+            return value.offsets.nbytes
+        if isinstance(value, TimestampProfile):
+            return value.deltas.nbytes
+        if isinstance(value, (dict, list)):
+            return len(value) * 64
+        return 0
+
+    def _add_size(self, sensor_path: str, entry: list, value):
+
+        # Account for an entry loaded in a cached sensor folder.
+        # param entry: The [data, size] entry of the folder, ignored once it has been evicted.
+
+        size = self._estimate_size(value)
+        with self.lock:
+            if self.entries.get(sensor_path) is entry:
+                entry[1] += size
+                self.current_bytes += size
+
+    def _evict(self, keep: str):
+
+        # Unload the least recently used folders until the cache fits in its budget.
+        # param keep: Path of the folder just requested, never evicted.
+
+        evicted = []
+        with self.lock:
+            for entry_path in list(self.entries):
+                if self.current_bytes <= self.max_bytes:
+                    break
+                if entry_path == keep:
+                    continue
+                evicted_data, evicted_size = self.entries.pop(entry_path)
+                self.current_bytes -= evicted_size
+                evicted.append(evicted_data)
+
+        # Dropping the cache reference is not enough while a check still holds the data
+        for evicted_data in evicted:
+            for file_data in (evicted_data or {}).values():
+                file_data.unload()
+
+    def get(self, sensor_path: str):
+
+        # Return the parsed data of a sensor folder, reading it on the first request.
+        # param sensor_path: Path to the sensor folder.
+        # return: Dictionary containing collected data, or None if the folder could not be read.
+
+        sensor_path = os.path.normpath(sensor_path)
+        with self.lock:
+            if sensor_path in self.entries:
+                self.entries.move_to_end(sensor_path)
+                return self.entries[sensor_path][0]
+
+            # The files are loaded lazily: each entry adds its size to the folder when it is read
+            entry = [None, 0]
+            data_manager = DataManager(sensor_path, snapshot=self.snapshot(sensor_path), on_load=lambda key, value: self._add_size(sensor_path, entry, value))
+            entry[0] = data_manager.get_data() if data_manager.read() else None
+            self.entries[sensor_path] = entry
+
+        self._evict(sensor_path)
+        return entry[0]
+
+    def load(self, sensor_path: str, keys) -> dict:
+
+        # Return the data of a sensor folder with the given entries of every recorded file already loaded.
+        # param sensor_path: Path to the sensor folder.
+        # param keys: Entries to load, e.g. ('txt', 'meta').
+
+        data = self.get(sensor_path)
+        for file_data in (data or {}).values():
+            for key in keys:
+                try:
+                    file_data[key]
+                except (OSError, ValueError):
+                    # Left pending: the check reading it reports the error
+                    pass
+        self._evict(os.path.normpath(sensor_path))
+        return data
+
+    def prefetch(self, recording_path: str, only=None, keys=('txt', 'meta')):
+
+        # Read ahead the data the planned checks of a recording folder will use.
+        # param recording_path: Path of the 6-digit recording folder.
+        # param only: Names of the selected checks, as given to the CheckScheduler.
+        # param keys: Entries loaded for each recorded file; the raw files stay mapped on demand.
+
+        start_bytes = read_bytes_count()
+        start = time.perf_counter()
+        plan = CheckScheduler(only).plan(self.snapshot(recording_path).names)
+        for sensor_plan in plan.sensor_plans:
+            if not sensor_plan.needs_data:
+                continue
+            self.load(os.path.join(recording_path, sensor_plan.sensor_name), [key for key in keys if key in sensor_plan.requires])
+            for sibling_name in sensor_plan.sibling_sensors:
+                self.load(os.path.join(recording_path, sibling_name), keys)
+        # The bytes are counted per thread, the Checker adds them to its data loading stage
+        self.prefetch_s += time.perf_counter() - start
+        self.prefetched_read_bytes += read_bytes_count() - start_bytes
+
+    def snapshot(self, folder_path: str) -> FolderSnapshot:
+
+        # Return the FolderSnapshot of a folder, scanning it on the first request.
+        # param folder_path: Path to the folder.
+
+        folder_path = os.path.normpath(folder_path)
+        if folder_path not in self.snapshots:
+            self.snapshots[folder_path] = FolderSnapshot(folder_path)
+        return self.snapshots[folder_path]
+
+    def clear(self):
+
+        # Unload every cached sensor folder and drop the folder snapshots.
+
+        with self.lock:
+            entries = list(self.entries.values())
+            self.entries.clear()
+            self.snapshots.clear()
+            self.current_bytes = 0
+        for data, _ in entries:
+            for file_data in (data or {}).values():
+                file_data.unload()
+
+
+class TimestampProfile:
+    """!
+    @brief Statistics of the timestamp column of one recorded file.
+
+    The frame durations are derived once from the '.txt' data and every frame-level
+    check (number of frames, record duration, abnormal frame duration, monotonicity)
+    reads its values from this profile instead of scanning the timestamps again.
+    The count, span and frame durations are computed with the profile; the duration
+    statistics, histogram, gaps and monotonicity are derived from the frame durations
+    on first use and kept.
+    """
+
+    def __init__(self, txt_data: np.ndarray):
+
+        # Compute the profile of a '.txt' array.
+        # param txt_data: Array of shape (number of frames, number of columns), timestamps in the first column.
+
+        timestamps = txt_data[:, 0] if txt_data.size else np.empty(0, dtype=np.int64)
+
+        self.frame_num = int(timestamps.size)
+        self.first_timestamp = int(timestamps[0]) if self.frame_num else None
+        self.last_timestamp = int(timestamps[-1]) if self.frame_num else None
+        self.span = (self.last_timestamp - self.first_timestamp) if self.frame_num else 0
+
+        # Duration of each frame (ms)
+        self.deltas = np.diff(timestamps)
+        self._delta_statistics = None
+        self._delta_histogram = None
+        self._gap_indices = None
+        self._timestamps_increasing = None
+        self._durations_monotonic = None
+
+    @property
+    def delta_statistics(self) -> tuple:
+
+        # (min, max, mean, std) of the frame durations (ms), Nones without durations, computed on first use.
+
+        if self._delta_statistics is None:
+            if self.deltas.size:
+                self._delta_statistics = (int(self.deltas.min()), int(self.deltas.max()),
+                                          float(self.deltas.mean()), float(self.deltas.std()))
+            else:
+                self._delta_statistics = (None, None, None, None)
+        return self._delta_statistics
+
+    @property
+    def min_delta(self):
+        return self.delta_statistics[0]
+
+    @property
+    def max_delta(self):
+        return self.delta_statistics[1]
+
+    @property
+    def mean_delta(self):
+        return self.delta_statistics[2]
+
+    @property
+    def std_delta(self):
+        return self.delta_statistics[3]
+
+    @property
+    def delta_histogram(self) -> dict:
+
+        # Number of frames of each frame duration (ms), computed on first use.
+
+        if self._delta_histogram is None:
+            values, counts = np.unique(self.deltas, return_counts=True)
+            self._delta_histogram = dict(zip(values.tolist(), counts.tolist()))
+        return self._delta_histogram
+
+    @property
+    def gap_indices(self) -> np.ndarray:
+
+        # Indices of the frames lasting more than twice the median frame duration, computed on first use.
+
+        if self._gap_indices is None:
+            if self.deltas.size:
+                self._gap_indices = np.flatnonzero(self.deltas > 2 * np.median(self.deltas))
+            else:
+                self._gap_indices = np.empty(0, dtype=np.int64)
+        return self._gap_indices
+
+    @property
+    def timestamps_increasing(self) -> bool:
+
+        # True if the timestamps strictly increase, computed on first use.
+
+        if self._timestamps_increasing is None:
+            self._timestamps_increasing = bool(np.all(self.deltas > 0))
+        return self._timestamps_increasing
+
+    @property
+    def durations_monotonic(self) -> bool:
+
+        # True if the frame durations never decrease, computed on first use.
+
+        if self._durations_monotonic is None:
+            self._durations_monotonic = bool(np.all(self.deltas[1:] >= self.deltas[:-1]))
+        return self._durations_monotonic
+
+    def serialize(self) -> dict:
+
+        # Return the scalar statistics of the profile.
+
+        return {'frame_num': self.frame_num, 'span (ms)': self.span, 'min_delta (ms)': self.min_delta,
+                'max_delta (ms)': self.max_delta, 'mean_delta (ms)': self.mean_delta, 'std_delta (ms)': self.std_delta,
+                'num_gaps': int(self.gap_indices.size), 'timestamps_increasing': self.timestamps_increasing}
+
+
+def index_segments(indices) -> list:
+    """!
+    @brief Group sorted frame indices into [first, last] segments of consecutive frames.
+
+    @param indices: Sorted frame indices.
+    @return segments: List of [first frame, last frame] pairs.
+    """
+
+    indices = np.asarray(indices, dtype=np.int64)
+    if not indices.size:
+        return []
+    breaks = np.flatnonzero(np.diff(indices) != 1)
+    starts = np.concatenate(([indices[0]], indices[breaks + 1]))
+    ends = np.concatenate((indices[breaks], [indices[-1]]))
+    return [[int(start), int(end)] for start, end in zip(starts, ends)]
+
+
+def get_timestamp_profile(file_data: dict) -> TimestampProfile:
+    """!
+    @brief Return the timestamp profile of one recorded file, computing it on first use.
+
+    @param file_data: Data of one basename as collected by DataManager ('txt', 'meta', ...).
+    @return profile: The TimestampProfile stored in file_data['profile'].
+    """
+
+    if file_data.get('profile') is None:
+        file_data['profile'] = TimestampProfile(file_data['txt'])
+    return file_data['profile']
+
+
+# Sensor folders checked by the Checker
+VIDEO_SENSORS = ('depth.kinect', 'ir.kinect', 'depth.flexx2', 'ir.flexx2', 'thermal.lepton')
+AUDIO_SENSORS = ('audio.kinect', 'audio.i2smems')
+
+# Registered Check subclasses, in the order they are run and reported
+CHECK_REGISTRY = []
+
+
+def register_check(check_class):
+    """!
+    @brief Class decorator adding a Check subclass to the CHECK_REGISTRY.
+
+    @param check_class: The Check subclass, with its 'scope', 'sensors' and 'requires' declared.
+    @return check_class: The same class.
+    """
+
+    CHECK_REGISTRY.append(check_class)
+    return check_class
+
+
+def check_registry_key() -> str:
+    """!
+    @brief Key identifying the registered checks and the code that runs them.
+
+    Covers the name, scope, sensors and requirements of every registered check and the source of
+    this module, so results stored by another version of the checks (e.g. before an upgrade that
+    adds a check or changes a code or a threshold computation) are not reused.
+
+    @return key: Hexadecimal SHA-1 digest.
+    """
+
+    key = hashlib.sha1()
+    for check_class in CHECK_REGISTRY:
+        key.update(f"{check_class.__name__}|{check_class.scope}|{','.join(check_class.sensors)}|{','.join(check_class.requires)}\n".encode())
+    with open(__file__, 'rb') as source:
+        key.update(source.read())
+    return key.hexdigest()
+
+
 class Check:
     """!
     @brief Parent class for each level of checking.
@@ -218,8 +999,17 @@ class Check:
     into a report.
 
     @note Subclasses should override the 'run_check' method to implement specific checks.
+
+    Each registered subclass declares how the scheduler uses it:
+    - `scope`: 'root' (recording folder), 'folder' (sensor folder) or 'file' (recorded file).
+    - `sensors`: Names of the sensor folders the check applies to (unused for root checks).
+    - `requires`: Data of the sensor folder read by the check ('meta', 'txt', 'rawv', 'rawa').
     """
 
+    scope = None
+    sensors = ()
+    requires = ()
+
     def __init__(self, data: dict, path: str):
         #""!
         #brief Class constructor.
@@ -228,10 +1018,13 @@ class Check:
         #param path: Path to the data directory.
         #""
         self.path = path
+        self.data = data
+        self.data_cache = None
         self.code = None
         self.description = None
         self.result = True
         self.report = {}
+        self.performance = {}
 
     def serialize(self) -> dict:
         #""!
@@ -242,7 +1035,71 @@ class Check:
         self.report = self.report | {'code': self.code, "description": self.description, "Result": self.result}
         return self.report
 
+    def measured_run(self) -> bool:
+        #""!
+        #brief Run the check and store its resource usage in 'performance'.
+
+        #The wall time, the CPU time of the running thread and the bytes it read from the
+        #recorded files belong to this check alone; the peak RSS is process-wide, its growth
+        #during the run is an upper bound when checks run in parallel.
+        #return: The result of 'run'.
+        #""
+        start_rss = peak_rss_kb()
+        start_bytes = read_bytes_count()
+        start_cpu = time.thread_time()
+        start_wall = time.perf_counter()
+
+        result = self.run()
+
+        end_rss = peak_rss_kb()
+        self.performance = {'wall_s': time.perf_counter() - start_wall,
+                            'cpu_s': time.thread_time() - start_cpu,
+                            'read_bytes': read_bytes_count() - start_bytes,
+                            'peak_rss_delta_kb': end_rss - start_rss if end_rss is not None else None}
+        return result
+
+    @classmethod
+    def report_name(cls, sensor_name: str = None) -> str:
+        #""!
+        #brief Name of the check in the JSON and Excel reports.
+        #""
+        return cls.__name__
+
+    @classmethod
+    def sibling_sensor(cls, sensor_name: str):
+        #""!
+        #brief Name of another sensor folder whose data the check needs, None if there is none.
+        #""
+        return None
+
+    @classmethod
+    def create(cls, sensor_data: dict, path: str, file_name: str = None, data_cache=None):
+        #""!
+        #brief Build the check from the data prepared by the scheduler.
+
+        #param sensor_data: Data of the sensor folder (empty for root checks).
+        #param path: Path of the recording folder (root checks) or of the sensor folder.
+        #param file_name: Basename of the recorded file for file checks.
+        #param data_cache: SensorDataCache of the recording.
+        #""
+        if cls.scope == 'file':
+            check = cls(sensor_data[file_name], path)
+        else:
+            check = cls(sensor_data, path)
+        check.data_cache = data_cache
+        return check
+
+    def snapshot(self, path: str = None) -> FolderSnapshot:
+        #""!
+        #brief FolderSnapshot of the checked folder (or of 'path'), shared through the SensorDataCache.
+        #""
+        path = path or self.path
+        if self.data_cache is not None:
+            return self.data_cache.snapshot(path)
+        return FolderSnapshot(path)
 
+
+@register_check
 class AbnormalFolderInRootCheck(Check):
     """!
     @brief Class for checking abnormal folders in the root directory.
@@ -254,6 +1111,8 @@ class AbnormalFolderInRootCheck(Check):
     @note Subclasses should override the 'run' method to implement specific checks.
     """
 
+    scope = 'root'
+
     def __init__(self, data: dict, path: str):
         #""!
         #brief Class constructor.
@@ -273,7 +1132,7 @@ class AbnormalFolderInRootCheck(Check):
 
         #return: True if no unexpected files found, False otherwise.
         #""
-        for name in os.listdir(self.path):
+        for name in self.snapshot().names:
             if name.lower() not in ('audio.kinect', 'color.kinect', 'depth.kinect', 'ir.kinect', 'audio.i2smems', 'depth.flexx2', 'ir.flexx2', 'thermal.lepton'):
                 self.num_unexp_file += 1 
                 self.unexp_file += (name + ' , ')
@@ -302,6 +1161,7 @@ class AbnormalFolderInRootCheck(Check):
         return self.report
 
 
+@register_check
 class EmptyFileInRootCheck(Check):
     """!
     @brief Class for checking empty files in the root directory.
@@ -313,6 +1173,8 @@ class EmptyFileInRootCheck(Check):
     @note Subclasses should override the 'run' method to implement specific checks.
     """
 
+    scope = 'root'
+
     def __init__(self, data: dict, path: str):
         #""!
         #brief Class constructor.
@@ -331,7 +1193,7 @@ class EmptyFileInRootCheck(Check):
 
         #return: True if no zero-size folders found, False otherwise.
         #""
-        sizes = get_folder_and_file_sizes(self.path)
+        sizes = get_folder_and_file_sizes(self.path, self.snapshot)
         for name in sizes:
             if sizes[name] == 0:
                 self.result = False
@@ -360,6 +1222,7 @@ class EmptyFileInRootCheck(Check):
 
 
 
+@register_check
 class NumberOfFilesCheck(Check):
     """!
     @brief Class for checking the number of files.
@@ -372,6 +1235,10 @@ class NumberOfFilesCheck(Check):
     @note Subclasses should override the 'run' method to implement specific checks.
     """
 
+    scope = 'folder'
+    sensors = VIDEO_SENSORS
+    requires = ('meta',)
+
     def __init__(self, data: dict, path: str):
         #""!
         #brief Class constructor.
@@ -398,7 +1265,8 @@ class NumberOfFilesCheck(Check):
 
         #return: True if the number of files check is successful, False otherwise.
         #""
-        self.num_file_found = len(os.listdir(self.path))
+        folder = self.snapshot()
+        self.num_file_found = len(folder.names)
 
         pattern = re.compile(r'file:\s+\d+/(\d+)')
         txt_meta_data = "\n".join(f"{key}: {value}" for key, value in self.meta_data.items())
@@ -415,25 +1283,19 @@ class NumberOfFilesCheck(Check):
             self.result = False
 
         self.num_raw_exp_files = file_value
-        for name in os.listdir(self.path):
-            if name.lower().endswith(('.rawv', '.rawa')):
-                self.num_raw_found_files += 1
+        self.num_raw_found_files = len(folder.with_extension('.rawv', '.rawa'))
 
         if not (self.num_raw_exp_files == self.num_raw_found_files):
             self.result = False
 
         self.num_meta_exp_files = file_value
-        for name in os.listdir(self.path):
-            if name.lower().endswith('.meta'):
-                self.num_meta_found_files += 1
+        self.num_meta_found_files = len(folder.with_extension('.meta'))
 
         if self.num_meta_exp_files != self.num_meta_found_files:
             self.result = False
 
         self.num_txt_exp_files = file_value
-        for name in os.listdir(self.path):
-            if name.lower().endswith('.txt'):
-                self.num_txt_found_files += 1
+        self.num_txt_found_files = len(folder.with_extension('.txt'))
 
         if self.num_txt_exp_files != self.num_txt_found_files:
             self.result = False
@@ -471,6 +1333,7 @@ class NumberOfFilesCheck(Check):
 
      
 
+@register_check
 class UnexpectedFileCheck(Check):
     """!
     @brief Class for checking unexpected file types.
@@ -482,6 +1345,9 @@ class UnexpectedFileCheck(Check):
     @note Subclasses should override the 'run' method to implement specific checks.
     """
 
+    scope = 'folder'
+    sensors = VIDEO_SENSORS
+
     def __init__(self, data, path: str):
     
         super().__init__(data, path)
@@ -492,7 +1358,7 @@ class UnexpectedFileCheck(Check):
 
     def run(self) -> bool:
         
-        for name in os.listdir(self.path):
+        for name in self.snapshot().names:
             if not (name.lower().endswith(('.meta', '.rawv', '.rawa', '.txt'))):
                 self.num_unexp_file += 1
                 self.unexp_file += (name + ' , ')
@@ -517,6 +1383,7 @@ class UnexpectedFileCheck(Check):
 
 
 
+@register_check
 class EmptyFilesCheck(Check):
     """!
     @brief Class for checking empty files.
@@ -528,6 +1395,9 @@ class EmptyFilesCheck(Check):
     @note Subclasses should override the 'run' method to implement specific checks.
     """
 
+    scope = 'folder'
+    sensors = VIDEO_SENSORS
+
     def __init__(self, data, path: str):
         
         super().__init__(data, path)
@@ -537,13 +1407,10 @@ class EmptyFilesCheck(Check):
 
     def run(self) -> bool:
          
-        w = os.walk(self.path)
-        for (dirpath, dirnames, filenames) in w:
-            for file in filenames:
-                file_size = os.path.getsize(dirpath + "/" + file)
-                if file_size == 0:
-                    self.result = False
-                    self.zero_size_file += (file + ' , ')
+        for file, file_size in self.snapshot().walk():
+            if file_size == 0:
+                self.result = False
+                self.zero_size_file += (file + ' , ')
         return self.result
     
     def detailed_serialize(self) -> dict:
@@ -560,6 +1427,7 @@ class EmptyFilesCheck(Check):
         return self.report
 
 
+@register_check
 class IrDepthFrameNumberConsistencyCheck(Check):
     """!
     @brief Class for checking consistency between IR and depth sensors Frame Numbers.
@@ -567,7 +1435,11 @@ class IrDepthFrameNumberConsistencyCheck(Check):
     This class checks if IR and depth sensors (e.g., ir.sensorX and depth.sensorX) have the same number of frames.
     """
 
-    def __init__(self, data: dict, file_name, path: str, second_sensor_path):
+    scope = 'file'
+    sensors = ('depth.kinect', 'depth.flexx2')
+    requires = ('meta', 'txt')
+
+    def __init__(self, data: dict, file_name, path: str, second_sensor_path, data_cache: SensorDataCache = None):
          
         super().__init__(data, path)
         self.code = "00011"
@@ -579,6 +1451,7 @@ class IrDepthFrameNumberConsistencyCheck(Check):
 
         self.first_sensor_path = path
         self.second_sensor_path = second_sensor_path
+        self.data_cache = data_cache
 
         self.first_sensor_name = os.path.basename(path)
         self.second_sensor_name = os.path.basename(second_sensor_path)
@@ -592,11 +1465,27 @@ class IrDepthFrameNumberConsistencyCheck(Check):
         self.difference_threshold = set_config.set_threshold("IrDepthFrameNumberConsistencyCheck")  # %
         self.difference = None  # the
 
+    @classmethod
+    def report_name(cls, sensor_name: str = None) -> str:
+        return f"{sensor_name.split('.')[-1]}_ir_depth_frame_number_consistency_check"
+
+    @classmethod
+    def sibling_sensor(cls, sensor_name: str):
+        return 'ir.' + sensor_name.split('.')[-1]
+
+    @classmethod
+    def create(cls, sensor_data: dict, path: str, file_name: str = None, data_cache=None):
+        second_sensor_path = os.path.join(os.path.dirname(path), cls.sibling_sensor(os.path.basename(path)))
+        return cls(sensor_data, file_name, path, second_sensor_path, data_cache)
+
     def run(self) -> bool:
          
-        second_sensor_data_manager = DataManager(self.second_sensor_path)
-        if second_sensor_data_manager.read():
-            self.second_sensor_data = second_sensor_data_manager.get_data()
+        if self.data_cache is not None:
+            self.second_sensor_data = self.data_cache.get(self.second_sensor_path)
+        else:
+            second_sensor_data_manager = DataManager(self.second_sensor_path)
+            if second_sensor_data_manager.read():
+                self.second_sensor_data = second_sensor_data_manager.get_data()
 
         first_sensor_frame_num = NumberOfFramesCheck(self.first_sensor_data[self.file_name], self.first_sensor_path)
         second_sensor_frame_num = NumberOfFramesCheck(self.second_sensor_data[self.file_name], self.second_sensor_path)
@@ -640,6 +1529,7 @@ class IrDepthFrameNumberConsistencyCheck(Check):
 
     
 
+@register_check
 class IrDepthTimestampsConsistencyCheck(Check):
     """!
     @brief Class for checking consistency between IR and depth sensors Timestamps.
@@ -647,7 +1537,11 @@ class IrDepthTimestampsConsistencyCheck(Check):
     This class checks if IR and depth sensors (e.g., ir.sensorX and depth.sensorX) have the same timestamps.
     """
 
-    def __init__(self, data: dict, file_name, path: str, second_sensor_path):
+    scope = 'file'
+    sensors = ('depth.kinect', 'depth.flexx2')
+    requires = ('txt',)
+
+    def __init__(self, data: dict, file_name, path: str, second_sensor_path, data_cache: SensorDataCache = None):
          
         super().__init__(data, path)
         self.code = "00012"
@@ -659,6 +1553,7 @@ class IrDepthTimestampsConsistencyCheck(Check):
 
         self.first_sensor_path = path
         self.second_sensor_path = second_sensor_path
+        self.data_cache = data_cache
 
         self.first_sensor_name = os.path.basename(path)
         self.second_sensor_name = os.path.basename(second_sensor_path)
@@ -671,20 +1566,36 @@ class IrDepthTimestampsConsistencyCheck(Check):
         self.first_sensor_txt_data = data[self.file_name]['txt']
         self.second_sensor_txt_data = None
 
+    @classmethod
+    def report_name(cls, sensor_name: str = None) -> str:
+        return f"{sensor_name.split('.')[-1]}_ir_depth_timestamps_consistency_check"
+
+    @classmethod
+    def sibling_sensor(cls, sensor_name: str):
+        return 'ir.' + sensor_name.split('.')[-1]
+
+    @classmethod
+    def create(cls, sensor_data: dict, path: str, file_name: str = None, data_cache=None):
+        second_sensor_path = os.path.join(os.path.dirname(path), cls.sibling_sensor(os.path.basename(path)))
+        return cls(sensor_data, file_name, path, second_sensor_path, data_cache)
+
     def run(self) -> bool:
          
-        second_sensor_data_manager = DataManager(self.second_sensor_path)
-        if second_sensor_data_manager.read():
-            self.second_sensor_data = second_sensor_data_manager.get_data()
+        if self.data_cache is not None:
+            self.second_sensor_data = self.data_cache.get(self.second_sensor_path)
+        else:
+            second_sensor_data_manager = DataManager(self.second_sensor_path)
+            if second_sensor_data_manager.read():
+                self.second_sensor_data = second_sensor_data_manager.get_data()
 
         self.second_sensor_txt_data = self.second_sensor_data[self.file_name]['txt']
 
-        timestamps_first_sensor = set([sub_array[0] for sub_array in self.first_sensor_txt_data])
-        timestamps_second_sensor = set([sub_array[0] for sub_array in self.second_sensor_txt_data])
+        timestamps_first_sensor = np.unique(self.first_sensor_txt_data[:, 0])
+        timestamps_second_sensor = np.unique(self.second_sensor_txt_data[:, 0])
 
-        intersection = timestamps_first_sensor.intersection(timestamps_second_sensor)
-        self.matching_percentage = (len(intersection) / len(timestamps_first_sensor)) * 100
-        self.unmatched_timestamps_number = len(timestamps_first_sensor) - len(intersection)
+        intersection = np.intersect1d(timestamps_first_sensor, timestamps_second_sensor, assume_unique=True)
+        self.matching_percentage = (intersection.size / timestamps_first_sensor.size) * 100
+        self.unmatched_timestamps_number = timestamps_first_sensor.size - intersection.size
 
         if self.matching_percentage < self.matching_percentage_threshold:
             self.result = False
@@ -711,6 +1622,7 @@ class IrDepthTimestampsConsistencyCheck(Check):
 
 
         
+@register_check
 class RawSizeCheck(Check):
     """!
     @brief Class to check the size of raw files.
@@ -718,33 +1630,46 @@ class RawSizeCheck(Check):
     This class checks the size of raw files and compares it with the expected size based on metadata.
     """
 
-    def __init__(self, data: dict, path: str):
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('meta', 'txt')
+
+    def __init__(self, data: dict, path: str, *, file_name: str = None):
          
         super().__init__(data, path)
+        self.file_name = file_name  # 00000, 00001, ... or None to compare every raw file of the folder
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.rawv_data = data["rawv"]
-        self.rawa_data = data["rawa"]
         self.difference_trsh = set_config.set_threshold("RawSizeCheck")
         self.code = "00201"
         self.description = "Check size of raw files"
         self.raw_file_detail = {}
 
+    @classmethod
+    def create(cls, sensor_data: dict, path: str, file_name: str = None, data_cache=None):
+        check = cls(sensor_data[file_name], path, file_name=file_name)
+        check.data_cache = data_cache
+        return check
+
     def run(self) -> bool:
          
-        frames_byte = [sublist[1] for sublist in self.txt_data]
-        exp_size = (np.sum(frames_byte)) / 1024
-        w = os.walk(self.path)
-        for (dirpath, dirnames, filenames) in w:
-            for file in filenames:
-                if file.lower().endswith(('.rawv', '.rawa')):
-                    found_size = (os.path.getsize(dirpath+"/"+file) / 1024)
-                    if self.difference_trsh < (abs(1 - int(found_size)/int(exp_size))*100):
-                        self.result = False
-                    self.raw_file_detail = {file: {'name': file, 'exp_size (KB)': int(exp_size),
-                                                   'found_size (KB)': int(found_size),
-                                                   'Difference_trsh %': self.difference_trsh,
-                                                   'Difference %': "{:.2f}".format(((1 - int(found_size) / int(exp_size)) * 100))}}
+        # Only the raw files recorded with the same basename are compared with the '.txt' frame sizes
+        exp_size = int(self.txt_data[:, 1].sum()) / 1024
+        folder = self.snapshot()
+        if self.file_name is None:
+            raw_files = sorted(name for name in folder.names if name.endswith(('.rawv', '.rawa')))
+        else:
+            raw_files = [f'{self.file_name}.{extension}' for extension in ('rawv', 'rawa')]
+        for file in raw_files:
+            if folder.size(file) is None:
+                continue
+            found_size = folder.size(file) / 1024
+            if self.difference_trsh < (abs(1 - int(found_size)/int(exp_size))*100):
+                self.result = False
+            self.raw_file_detail[file] = {'name': file, 'exp_size (KB)': int(exp_size),
+                                          'found_size (KB)': int(found_size),
+                                          'Difference_trsh %': self.difference_trsh,
+                                          'Difference %': "{:.2f}".format(((1 - int(found_size) / int(exp_size)) * 100))}
 
         return self.result
 
@@ -761,6 +1686,7 @@ class RawSizeCheck(Check):
 
 
 
+@register_check
 class NumberOfFramesCheck(Check):
     """
     @brief Class to check the number of frames captured by the sensor.
@@ -768,12 +1694,15 @@ class NumberOfFramesCheck(Check):
     This class checks the number of frames captured by the sensor and compares it with the expected number based on metadata.
     """
 
+    scope = 'file'
+    sensors = ('depth.kinect', 'ir.kinect', 'depth.flexx2', 'ir.flexx2')
+    requires = ('meta', 'txt')
+
     def __init__(self, data: dict, path: str):
          
         super().__init__(data, path)
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.rawv_data = data["rawv"]
         self.difference_trsh = set_config.set_threshold("NumberOfFramesCheck")  # %
         self.code = "00301"
         self.description = "Checking the number of frames captured by the sensor"
@@ -786,7 +1715,7 @@ class NumberOfFramesCheck(Check):
          
         index_s = self.meta_data['duration'].find('s')
         self.exp_frm_num = (int(self.meta_data['duration'][:index_s]) * int(self.meta_data['framerate']))
-        self.recorded_frame_num = (np.shape(self.txt_data))[0]
+        self.recorded_frame_num = get_timestamp_profile(self.data).frame_num
         self.difference_num_frame = abs(self.exp_frm_num - self.recorded_frame_num)
         self.difference = (abs(1 - self.recorded_frame_num / self.exp_frm_num) * 100)
         if self.difference_trsh < self.difference:
@@ -812,6 +1741,7 @@ class NumberOfFramesCheck(Check):
        
         
        
+@register_check
 class VRecordDurationCheck(Check):
     """!
     @brief Class to check the duration of the Video file captured by the sensor.
@@ -819,12 +1749,15 @@ class VRecordDurationCheck(Check):
     This class checks the duration of the video file captured by the sensor and compares it with the expected duration based on metadata.
     """
 
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('meta', 'txt')
+
     def __init__(self, data: dict, path: str):
          
         super().__init__(data, path)
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.raw_data = data["rawv"]
         self.code = "00302"
         self.description = "Checking the duration of the Video file captured by the sensor"
         self.exp_rec_duration = None
@@ -836,10 +1769,11 @@ class VRecordDurationCheck(Check):
     def run(self) -> bool:
          
         index_s = self.meta_data['duration'].find('s')
-        self.recorded_frame_num = (np.shape(self.txt_data))[0]
+        profile = get_timestamp_profile(self.data)
+        self.recorded_frame_num = profile.frame_num
 
         self.exp_rec_duration = (int(self.meta_data['duration'][:index_s])) * 1000
-        self.act_rec_duration = self.txt_data[self.recorded_frame_num - 1][0] - self.txt_data[0][0]
+        self.act_rec_duration = profile.span
         self.difference = (abs(1 - self.act_rec_duration / self.exp_rec_duration) * 100)
 
         if self.difference_trsh < self.difference:
@@ -863,6 +1797,7 @@ class VRecordDurationCheck(Check):
 
 
 
+@register_check
 class AbnormalFrameDurationCheck(Check):
     """!
     @brief Class to check the duration of each frame and compare it with the normal frame duration.
@@ -870,37 +1805,39 @@ class AbnormalFrameDurationCheck(Check):
     This class checks the duration of each frame in the sensor data and compares it with the expected frame duration.
     """
 
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('meta', 'txt')
+
     def __init__(self, data: dict, path: str):
          
         super().__init__(data, path)
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.raw_data = data["rawv"]
         self.code = "00303"
         self.description = "Checking the duration of each frame and comparing it with the normal frame duration"
         self.configured_frm_duration = None
         self.duration_difference_threshold = None
         self.ratio_trsh = set_config.set_threshold("AbnormalFrameDurationCheck")  # Threshold for the number of abnormal frames duration in %
         self.num_abn_frm_drt = 0
-        self.abn_frms_drt = []
+        self.abn_frms_drt = np.empty(0, dtype=np.int64)   # Durations of the abnormal frames (ms)
+        self.abn_frms_idx = np.empty(0, dtype=np.int64)   # Indices of the frames preceding an abnormal duration
         self.recorded_frame_num = 0
         self.ratio = 0
 
     def run(self) -> bool:
          
-        self.recorded_frame_num = (np.shape(self.txt_data))[0]
-        timestamps = []
-        abn_frms_drt = []
-        for x in range(0, self.recorded_frame_num - 1):
-            timestamps.append(self.txt_data[x + 1][0] - self.txt_data[x][0])
+        profile = get_timestamp_profile(self.data)
+        self.recorded_frame_num = profile.frame_num
+        timestamps = profile.deltas
 
         self.configured_frm_duration = (1 / int(self.meta_data['framerate'])) * 1000
         self.duration_difference_threshold = (self.configured_frm_duration / 2)
 
-        for frm_drt in timestamps:
-            if abs(frm_drt - self.configured_frm_duration) > self.duration_difference_threshold:
-                self.num_abn_frm_drt += 1
-                self.abn_frms_drt.append(frm_drt)
+        abnormal = np.abs(timestamps - self.configured_frm_duration) > self.duration_difference_threshold
+        self.abn_frms_idx = np.flatnonzero(abnormal)
+        self.abn_frms_drt = timestamps[abnormal]
+        self.num_abn_frm_drt = int(self.abn_frms_idx.size)
 
         self.ratio = ((self.num_abn_frm_drt / self.recorded_frame_num) * 100)
         if self.ratio_trsh < self.ratio:
@@ -926,6 +1863,7 @@ class AbnormalFrameDurationCheck(Check):
 
 
 
+@register_check
 class GrowingMonotonicallyCheck(Check):
     """!
     @brief Class to check that the duration of each frame is not monotonically.
@@ -933,12 +1871,15 @@ class GrowingMonotonicallyCheck(Check):
     This class checks whether the duration of each frame is monotonically increasing or not.
     """
 
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('meta', 'txt')
+
     def __init__(self, data: dict, path: str):
          
         super().__init__(data, path)
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.raw_data = data["rawv"]
         self.code = "00304"
         self.description = "Checking that the duration of each frame is not monotonically"
         self.exp_rec_duration = None
@@ -947,12 +1888,7 @@ class GrowingMonotonicallyCheck(Check):
 
     def run(self) -> bool:
          
-        # Calculating the number of frames recorded by sensors
-        recorded_frame_num = (np.shape(self.txt_data))[0]
-        # Calculating each timestamps (or each frame duration):
-        timestamps = [self.txt_data[x + 1][0] - self.txt_data[x][0] for x in range(0, recorded_frame_num - 1)]
-
-        is_monotonic = all(timestamps[i] <= timestamps[i + 1] for i in range(len(timestamps) - 1))
+        is_monotonic = get_timestamp_profile(self.data).durations_monotonic
         if is_monotonic:
             self.result = False
 
@@ -971,6 +1907,218 @@ class GrowingMonotonicallyCheck(Check):
 
 
 
+@register_check
+class FrozenFrameCheck(Check):
+    """!
+    @brief Class to detect frozen (duplicated) consecutive frames in a video file.
+
+    This class streams the frames of the '.rawv' file, hashes each one and reports the runs of
+    identical consecutive frames, the typical symptom of a stuck sensor that timestamp-only checks miss.
+    By default only every 'byte_stride'-th byte of a frame is hashed, so a frame whose hash repeats the
+    previous one is compared with it in full before it counts as frozen. Runs of constant frames (every
+    byte equal, e.g. black frames) are left to BlackSaturatedFrameCheck.
+    """
+
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('txt', 'rawv')
+
+    def __init__(self, data: dict, path: str):
+
+        super().__init__(data, path)
+        self.raw_data = data["rawv"]
+        self.code = "00305"
+        self.description = "Checking the video file for frozen (identical consecutive) frames"
+        self.ratio_trsh = set_config.set_threshold("FrozenFrameCheck")  # Threshold for the number of frozen frames in %
+        self.min_frozen_frames = int(set_config.get_setting('frozen_frame_check', 'min_frozen_frames', 3))
+        self.byte_stride = max(1, int(set_config.get_setting('frozen_frame_check', 'byte_stride', 64)))
+        self.checked_frame_num = 0
+        self.num_frozen_frames = 0
+        self.frozen_segments = []   # [first frame, last frame] of each frozen run
+        self.ratio = 0
+
+    def _hash_frame(self, frame: np.ndarray) -> int:
+
+        # Hash the frame bytes, only every 'byte_stride'-th byte when subsampling.
+
+        if self.byte_stride > 1:
+            frame = np.ascontiguousarray(frame[::self.byte_stride])
+        if xxhash is not None:
+            return xxhash.xxh3_64_intdigest(frame)
+        return zlib.crc32(frame)
+
+    def run(self) -> bool:
+
+        if not isinstance(self.raw_data, RawFrameReader):
+            return self.result
+
+        run_start = 0
+        run_constant = None
+        previous_hash = None
+        previous_frame = None
+        for index, frame in self.raw_data.iter_frames():
+            frame_hash = self._hash_frame(frame)
+            # A subsampled hash skips bytes: the candidate duplicates are compared in full
+            if frame_hash != previous_hash or (self.byte_stride > 1 and not np.array_equal(frame, previous_frame)):
+                self._close_run(run_start, index - 1, run_constant)
+                run_start = index
+                run_constant = None
+            elif run_constant is None:
+                # Only the frames repeating the previous one are scanned for a constant value
+                run_constant = bool(frame.min() == frame.max())
+            previous_hash = frame_hash
+            previous_frame = frame
+        self._close_run(run_start, len(self.raw_data) - 1, run_constant)
+
+        self.checked_frame_num = len(self.raw_data)
+        if self.checked_frame_num:
+            self.ratio = (self.num_frozen_frames / self.checked_frame_num) * 100
+        if self.ratio_trsh < self.ratio:
+            self.result = False
+
+        return self.result
+
+    def _close_run(self, first_frame: int, last_frame: int, constant: bool = False):
+
+        # Record a run of identical frames if it is long enough and its frames are not constant.
+
+        if not constant and last_frame - first_frame + 1 >= self.min_frozen_frames:
+            self.frozen_segments.append([first_frame, last_frame])
+            # The first frame of a run is a regular frame, the following ones are frozen
+            self.num_frozen_frames += last_frame - first_frame
+
+    def detailed_serialize(self) -> dict:
+
+        super().serialize()
+        self.report = self.report | {'checked_frame_num': self.checked_frame_num,
+                                     'num_frozen_frames': self.num_frozen_frames,
+                                     'frozen_segments': self.frozen_segments,
+                                     'Ratio_threshold (frozen / all)%': self.ratio_trsh,
+                                     'Ratio (frozen / all)%': self.ratio}
+        return self.report
+
+    def light_serialize(self) -> dict:
+
+        super().serialize()
+        return self.report
+
+
+
+@register_check
+class BlackSaturatedFrameCheck(Check):
+    """!
+    @brief Class to detect black, saturated and mostly invalid frames in a video file.
+
+    This class computes the mean, minimum, maximum and zero-pixel fraction of every frame of the
+    '.rawv' file in blocks of frames and flags the frames that are all black, saturated or, for
+    depth sensors, mostly made of invalid (zero) pixels. The pixel layout of each sensor is read
+    from 'configure_settings.json'.
+    """
+
+    scope = 'file'
+    sensors = VIDEO_SENSORS
+    requires = ('txt', 'rawv')
+
+    def __init__(self, data: dict, path: str):
+
+        super().__init__(data, path)
+        self.raw_data = data["rawv"]
+        self.code = "00306"
+        self.description = "Checking the video file for black, saturated or invalid frames"
+        self.sensor_name = os.path.basename(os.path.normpath(path))
+        self.ratio_trsh = set_config.set_threshold("BlackSaturatedFrameCheck")  # Threshold for the number of bad frames in %
+
+        pixel_format = set_config.get_setting('pixel_content_check', 'pixel_formats', {}).get(self.sensor_name, {})
+        self.dtype = np.dtype(pixel_format.get('dtype', 'uint16'))
+        self.saturation_value = pixel_format.get('saturation', int(np.iinfo(self.dtype).max))
+        self.black_level = set_config.get_setting('pixel_content_check', 'black_level', 0)
+        self.saturated_fraction_trsh = set_config.get_setting('pixel_content_check', 'saturated_fraction', 0.9)
+        self.invalid_fraction_trsh = set_config.get_setting('pixel_content_check', 'invalid_depth_fraction', 0.9)
+        self.frames_per_block = int(set_config.get_setting('pixel_content_check', 'frames_per_block', 64))
+        # Integer pixels are summed exactly, and faster, in int64
+        self.sum_dtype = np.int64 if self.dtype.kind in 'iu' else np.float64
+
+        # Per-frame statistics
+        self.frame_mean = np.empty(0)
+        self.frame_min = np.empty(0)
+        self.frame_max = np.empty(0)
+        self.frame_zero_fraction = np.empty(0)
+
+        self.checked_frame_num = 0
+        self.black_frames = np.empty(0, dtype=np.int64)
+        self.saturated_frames = np.empty(0, dtype=np.int64)
+        self.invalid_frames = np.empty(0, dtype=np.int64)
+        self.num_bad_frames = 0
+        self.ratio = 0
+
+    def run(self) -> bool:
+
+        if not isinstance(self.raw_data, RawFrameReader) or not len(self.raw_data):
+            return self.result
+
+        means, mins, maxs, zero_fractions, saturated_fractions = [], [], [], [], []
+        for _, block in self.raw_data.iter_blocks(self.frames_per_block, self.dtype):
+            block_min = block.min(axis=1)
+            block_max = block.max(axis=1)
+            means.append(block.sum(axis=1, dtype=self.sum_dtype) / block.shape[1])
+            mins.append(block_min)
+            maxs.append(block_max)
+
+            # Pixels are only counted, all at once, in the frames that can contain zero or saturated pixels
+            zero_fraction = np.zeros(block.shape[0])
+            rows = block_min == 0
+            if rows.any():
+                zero_fraction[rows] = (block[rows] == 0).sum(axis=1, dtype=np.uint32) / block.shape[1]
+            saturated_fraction = np.zeros(block.shape[0])
+            rows = block_max >= self.saturation_value
+            if rows.any():
+                saturated_fraction[rows] = (block[rows] >= self.saturation_value).sum(axis=1, dtype=np.uint32) / block.shape[1]
+            zero_fractions.append(zero_fraction)
+            saturated_fractions.append(saturated_fraction)
+
+        self.frame_mean = np.concatenate(means)
+        self.frame_min = np.concatenate(mins)
+        self.frame_max = np.concatenate(maxs)
+        self.frame_zero_fraction = np.concatenate(zero_fractions)
+        saturated_fraction = np.concatenate(saturated_fractions)
+
+        black = self.frame_max <= self.black_level
+        saturated = saturated_fraction >= self.saturated_fraction_trsh
+        invalid = (self.frame_zero_fraction >= self.invalid_fraction_trsh) & ~black if self.sensor_name.startswith('depth.') else np.zeros_like(black)
+
+        self.black_frames = np.flatnonzero(black)
+        self.saturated_frames = np.flatnonzero(saturated)
+        self.invalid_frames = np.flatnonzero(invalid)
+
+        self.checked_frame_num = int(self.frame_mean.size)
+        self.num_bad_frames = int(np.count_nonzero(black | saturated | invalid))
+        self.ratio = (self.num_bad_frames / self.checked_frame_num) * 100
+        if self.ratio_trsh < self.ratio:
+            self.result = False
+
+        return self.result
+
+    def detailed_serialize(self) -> dict:
+
+        super().serialize()
+        self.report = self.report | {'checked_frame_num': self.checked_frame_num,
+                                     'num_black_frames': int(self.black_frames.size),
+                                     'num_saturated_frames': int(self.saturated_frames.size),
+                                     'num_invalid_frames': int(self.invalid_frames.size),
+                                     'black_segments': index_segments(self.black_frames),
+                                     'saturated_segments': index_segments(self.saturated_frames),
+                                     'invalid_segments': index_segments(self.invalid_frames),
+                                     'Ratio_threshold (bad / all)%': self.ratio_trsh,
+                                     'Ratio (bad / all)%': self.ratio}
+        return self.report
+
+    def light_serialize(self) -> dict:
+
+        super().serialize()
+        return self.report
+
+
+
 class ARecordDurationCheck(Check):
     """!
     @brief Class to check the duration of the Audio file captured by the sensor.
@@ -978,12 +2126,15 @@ class ARecordDurationCheck(Check):
     This class checks whether the duration of the audio file matches the expected duration based on metadata.
     """
 
+    # Not registered: no audio sensor is scheduled for it
+    scope = 'file'
+    requires = ('meta', 'txt')
+
     def __init__(self, data: dict, path: str):
         
         super().__init__(data, path)
         self.meta_data = data['meta']
         self.txt_data = data['txt']
-        self.rawa_data = data["rawa"]
         self.code = "00302"
         self.description = "Checking the duration of the Audio file captured by the sensor"
         self.exp_rec_duration = None
@@ -995,10 +2146,11 @@ class ARecordDurationCheck(Check):
     def run(self) -> bool:
          
         self.one_smpl_duration = (1 / int(self.meta_data['rate'])) * 1000  # Calculating the frame duration in ms.
-        self.recorded_samples_num = (np.shape(self.txt_data))[0]
+        profile = get_timestamp_profile(self.data)
+        self.recorded_samples_num = profile.frame_num
 
         self.exp_rec_duration = (int(self.meta_data['duration'][:2])) * 1000
-        self.act_rec_duration = self.txt_data[self.recorded_samples_num - 1][0] - self.txt_data[0][0]
+        self.act_rec_duration = profile.span
 
         self.Diff_Between_duration = abs(self.exp_rec_duration - self.act_rec_duration)
         if self.Diff_Between_duration > self.one_smpl_duration:
@@ -1022,6 +2174,220 @@ class ARecordDurationCheck(Check):
         return self.report
 
 
+@register_check
+class AudioContentCheck(Check):
+    """!
+    @brief Class to check the samples of the Audio file captured by the sensor.
+
+    This class streams the memory-mapped '.rawa' file in windows and computes the RMS level of
+    each window, the ratio of clipped samples and the runs of digital silence (all-zero windows).
+    Long silent runs are reported as silence, short ones inside the recording as dropouts.
+    The sample layout of each sensor is read from 'configure_settings.json'.
+    """
+
+    scope = 'file'
+    sensors = AUDIO_SENSORS
+    requires = ('meta', 'txt', 'rawa')
+
+    def __init__(self, data: dict, path: str):
+
+        super().__init__(data, path)
+        self.meta_data = data['meta']
+        self.rawa_data = data["rawa"]
+        self.code = "00401"
+        self.description = "Checking the Audio file for clipping, silence and dropouts"
+        self.sensor_name = os.path.basename(os.path.normpath(path))
+        self.clipping_trsh = set_config.set_threshold("AudioContentCheck")  # Threshold for the clipped samples in %
+
+        sample_format = set_config.get_setting('audio_content_check', 'sample_formats', {}).get(self.sensor_name, {})
+        self.dtype = np.dtype(sample_format.get('dtype', 'int16'))
+        self.channels = int(self.meta_data.get('channels', sample_format.get('channels', 1)))
+        self.full_scale = sample_format.get('full_scale', float(np.iinfo(self.dtype).max) if self.dtype.kind in 'iu' else 1.0)
+        self.rate = int(self.meta_data.get('rate', sample_format.get('rate', 48000)))
+
+        self.window_ms = set_config.get_setting('audio_content_check', 'window_ms', 20)
+        self.clip_level = set_config.get_setting('audio_content_check', 'clip_level', 0.999)
+        self.min_silence_ms = set_config.get_setting('audio_content_check', 'min_silence_ms', 500)
+        self.silence_trsh = set_config.get_setting('audio_content_check', 'silence_ratio', 50)
+        self.max_dropouts = set_config.get_setting('audio_content_check', 'max_dropouts', 0)
+        self.windows_per_block = int(set_config.get_setting('audio_content_check', 'windows_per_block', 64))
+
+        self.window_rms = np.empty(0)
+        self.checked_samples_num = 0
+        self.num_clipped_samples = 0
+        self.clipping_ratio = 0
+        self.silence_segments = []  # [first window, last window] of the long silent runs
+        self.dropout_segments = []  # [first window, last window] of the short silent runs
+        self.silence_ratio = 0
+
+    def run(self) -> bool:
+
+        if not isinstance(self.rawa_data, RawFrameReader) or not self.rawa_data.file_size:
+            return self.result
+
+        frame_bytes = self.dtype.itemsize * self.channels
+        window_len = max(1, int(self.rate * self.window_ms / 1000))
+        samples = self.rawa_data.memmap[:self.rawa_data.file_size - self.rawa_data.file_size % frame_bytes].view(self.dtype).reshape(-1, self.channels)
+        window_num = samples.shape[0] // window_len
+        clip_high, clip_low = self._clip_bounds(self.clip_level * self.full_scale)
+
+        rms = []
+        silent = []
+        # The float64 squares of a block are its only large temporary: the blocks are kept small
+        block_len = window_len * self.windows_per_block
+        for start in range(0, window_num * window_len, block_len):
+            block = samples[start:min(start + block_len, window_num * window_len)]
+            windows = block.reshape(-1, window_len * self.channels)
+            rms.append(np.sqrt(np.mean(np.square(windows, dtype=np.float64), axis=1)))
+            silent.append(~windows.any(axis=1))
+            # The samples are compared in their own type, and only in blocks reaching a bound
+            if clip_high is not None and block.max() >= clip_high:
+                self.num_clipped_samples += int(np.count_nonzero(block >= clip_high))
+            if clip_low is not None and block.min() <= clip_low:
+                self.num_clipped_samples += int(np.count_nonzero(block <= clip_low))
+
+        self.checked_samples_num = window_num * window_len * self.channels
+        if not window_num:
+            return self.result
+
+        self.window_rms = np.concatenate(rms)
+        silent = np.concatenate(silent)
+        self.clipping_ratio = (self.num_clipped_samples / self.checked_samples_num) * 100
+
+        min_silence_windows = max(1, int(np.ceil(self.min_silence_ms / self.window_ms)))
+        for first_window, last_window in index_segments(np.flatnonzero(silent)):
+            if last_window - first_window + 1 >= min_silence_windows:
+                self.silence_segments.append([first_window, last_window])
+            elif first_window > 0 and last_window < window_num - 1:
+                self.dropout_segments.append([first_window, last_window])
+        self.silence_ratio = (np.count_nonzero(silent) / window_num) * 100
+
+        if (self.clipping_trsh < self.clipping_ratio or self.silence_trsh < self.silence_ratio
+                or self.max_dropouts < len(self.dropout_segments)):
+            self.result = False
+
+        return self.result
+
+    def _clip_bounds(self, clip_value: float) -> tuple:
+
+        # Bounds in the sample type such that |sample| >= clip_value <=> sample >= high or sample <= low.
+        # return: (high, low), None for a bound no sample can reach.
+
+        if clip_value <= 0:
+            # Every sample is clipped
+            return (np.iinfo(self.dtype).min if self.dtype.kind in 'iu' else self.dtype.type(-np.inf)), None
+        if self.dtype.kind in 'iu':
+            info = np.iinfo(self.dtype)
+            high = int(np.ceil(clip_value))
+            low = -high
+            return (self.dtype.type(high) if high <= info.max else None,
+                    self.dtype.type(low) if low >= info.min else None)
+        # Smallest value of the sample type that is not below clip_value
+        high = self.dtype.type(clip_value)
+        if high < clip_value:
+            high = np.nextafter(high, self.dtype.type(np.inf))
+        return high, -high
+
+    def detailed_serialize(self) -> dict:
+
+        super().serialize()
+        self.report = self.report | {'window_ms': self.window_ms,
+                                     'checked_samples_num': self.checked_samples_num,
+                                     'mean_rms': float(self.window_rms.mean()) if self.window_rms.size else None,
+                                     'num_clipped_samples': self.num_clipped_samples,
+                                     'Clipping_threshold %': self.clipping_trsh,
+                                     'Clipping %': self.clipping_ratio,
+                                     'Silence_threshold %': self.silence_trsh,
+                                     'Silence %': self.silence_ratio,
+                                     'silence_segments (windows)': self.silence_segments,
+                                     'dropout_segments (windows)': self.dropout_segments}
+        return self.report
+
+    def light_serialize(self) -> dict:
+
+        super().serialize()
+        return self.report
+
+
+class SensorPlan:
+    """!
+    @brief Checks scheduled for one sensor folder.
+    """
+
+    def __init__(self, sensor_name: str, folder_checks: list, file_checks: list):
+
+        self.sensor_name = sensor_name
+        self.folder_checks = folder_checks
+        self.file_checks = file_checks
+        self.requires = {data for check_class in folder_checks + file_checks for data in check_class.requires}
+        self.sibling_sensors = {check_class.sibling_sensor(sensor_name) for check_class in file_checks} - {None}
+        # The recorded files of a folder are only known once its data is read
+        self.needs_data = bool(self.requires or self.file_checks)
+
+
+class CheckPlan:
+    """!
+    @brief Execution plan of a recording folder: root checks, then the checks of each sensor folder.
+    """
+
+    def __init__(self, root_checks: list, sensor_plans: list):
+
+        self.root_checks = root_checks
+        self.sensor_plans = sensor_plans
+
+
+class CheckScheduler:
+    """!
+    @brief Resolve the CHECK_REGISTRY into the execution plan of a recording folder.
+
+    The checks keep their registration order; a sensor folder is planned only if at least
+    one selected check applies to it.
+    """
+
+    def __init__(self, only=None):
+
+        # param only: Names of the checks to run (class or report names), all registered checks if None.
+
+        self.check_classes = list(CHECK_REGISTRY)
+        if only:
+            only = set(only)
+            known_names = {check_class.__name__ for check_class in CHECK_REGISTRY}
+            known_names |= {check_class.report_name(sensor) for check_class in CHECK_REGISTRY for sensor in check_class.sensors}
+            unknown_names = only - known_names
+            if unknown_names:
+                raise ValueError(f"Unknown checks: {', '.join(sorted(unknown_names))}")
+            self.only = only
+        else:
+            self.only = None
+
+    def _selected(self, check_class, sensor_name: str = None) -> bool:
+
+        # A check is selected by its class name or by its report name for this sensor.
+
+        if self.only is None:
+            return True
+        return check_class.__name__ in self.only or check_class.report_name(sensor_name) in self.only
+
+    def plan(self, folder_names) -> CheckPlan:
+
+        # Build the plan for the folders found in a recording folder.
+        # param folder_names: Names of the entries of the recording folder, in the order they are checked.
+
+        root_checks = [check_class for check_class in self.check_classes
+                       if check_class.scope == 'root' and self._selected(check_class)]
+
+        sensor_plans = []
+        for sensor_name in folder_names:
+            folder_checks = [check_class for check_class in self.check_classes
+                             if check_class.scope == 'folder' and sensor_name in check_class.sensors and self._selected(check_class, sensor_name)]
+            file_checks = [check_class for check_class in self.check_classes
+                           if check_class.scope == 'file' and sensor_name in check_class.sensors and self._selected(check_class, sensor_name)]
+            if folder_checks or file_checks:
+                sensor_plans.append(SensorPlan(sensor_name, folder_checks, file_checks))
+
+        return CheckPlan(root_checks, sensor_plans)
+
+
 class Checker:
     """!
     @brief Main class of the package to manage all the level of checkers.
@@ -1030,15 +2396,28 @@ class Checker:
     and calls the appropriate checkers and processes the result to build a report.
     """
 
-    def __init__(self, path="mypath", light_mode=True):
-         
+    def __init__(self, path="mypath", light_mode=True, only=None, check_threads=1, data_cache=None, collect_metrics=False):
+
+        # param only: Names of the checks to run (class or report names), all registered checks if None.
+        # param check_threads: Number of threads running the checks of one recorded file.
+        # param data_cache: SensorDataCache already filled for this recording (see SensorDataCache.prefetch), a new one if None.
+        # param collect_metrics: In light mode, also keep the detailed serialization of every check in 'check_records'.
+
         self.data = {}
         self.report = {}
         self.excel_report = {}
         self.path = path
         self.light_mode = light_mode
+        self.only = only
+        self.check_threads = max(1, int(check_threads))
         self.result = True
         self.setting_data = None
+        self.data_cache = data_cache
+        # Stage timings, bytes read by the stages and resource usage of every check, see 'measured_run'
+        self.performance = {'stages': {}, 'stage_read_bytes': {}, 'checks': []}
+        # Detailed record of every check (level, sensor, file, check and its fields), None if not collected;
+        # in detailed mode the same records are found in the report
+        self.check_records = [] if collect_metrics and light_mode else None
 
     def run(self):
         
@@ -1065,29 +2444,37 @@ class Checker:
 
         @return: Tuple containing the result, detailed report, and Excel report.
         """
+        run_start = time.perf_counter()
+        stages = self.performance['stages']
+        stages.update({'planning_s': 0.0, 'data_loading_s': 0.0, 'root_checks_s': 0.0, 'folder_checks_s': 0.0, 'file_checks_s': 0.0})
+
+        # Each sensor folder of this recording is parsed only once
+        if self.data_cache is None:
+            self.data_cache = SensorDataCache()
+        plan = CheckScheduler(self.only).plan(self.data_cache.snapshot(self.path).names)
+        stages['planning_s'] = time.perf_counter() - run_start
+
+        # The files read ahead by a prefetching thread count as data loading, not as reads of the checks
+        if self.data_cache.prefetch_s:
+            stages['prefetch_s'] = self.data_cache.prefetch_s
+        loading_bytes = self.data_cache.prefetched_read_bytes
+
         # Loading overall report for adding new data:
         # Root checking
         self.excel_report['Root_Checking'] = {}
         root_report = {}
         root_result = True
 
-        # AbnormalFolderInRootCheck
-        abn_fld_path = AbnormalFolderInRootCheck(self.data, self.path)
-        abn_fld_path_result = abn_fld_path.run()
-        self.excel_report['Root_Checking']['AbnormalFolderInRootCheck'] = abn_fld_path_result
-
-        if not abn_fld_path_result:
-            root_result = False
-        root_report['AbnormalFolderInRootCheck'] = abn_fld_path.light_serialize() if self.light_mode else abn_fld_path.detailed_serialize()
-
-        # EmptyFileInRootCheck
-        emp_file_path = EmptyFileInRootCheck(self.data, self.path)
-        emp_file_path_result = emp_file_path.run()
-        self.excel_report['Root_Checking']['EmptyFileInRootCheck'] = emp_file_path_result
-
-        if not emp_file_path_result:
-            root_result = False
-        root_report['EmptyFileInRootCheck'] = emp_file_path.light_serialize() if self.light_mode else emp_file_path.detailed_serialize()
+        stage_start = time.perf_counter()
+        for check_class in plan.root_checks:
+            check = check_class.create(self.data, self.path, data_cache=self.data_cache)
+            check_result = check.measured_run()
+            if not check_result:
+                root_result = False
+            self._record(check, check_class.report_name(), check_result, root_report, self.excel_report['Root_Checking'])
+            self._record_metrics(check, check_class.report_name(), 'root')
+            self._record_performance(check, check_class.report_name(), 'Root_Checking')
+        stages['root_checks_s'] += time.perf_counter() - stage_start
 
         self.report['Root_Checking'] = {'Status': root_result}
         self.report['Root_Checking']['Checkers'] = root_report
@@ -1098,141 +2485,109 @@ class Checker:
         self.report['Sensors_checking'] = {}
         sensor_check_result = True
 
-
-        for name in os.listdir(self.path):
-            if name in ['depth.kinect', 'ir.kinect', 'depth.flexx2', 'ir.flexx2', 'thermal.lepton']:
-                sensor_report = {'Folder_Checking': {}, 'File_Checking': {}}
-                sensor_data_manager = DataManager(os.path.join(self.path, name))
-                if sensor_data_manager.read():
-                    self.data = sensor_data_manager.get_data()
-
-                    # NumberOfFilesCheck
-                    num_files_check = NumberOfFilesCheck(self.data, os.path.join(self.path, name))
-                    nf_check_result = num_files_check.run()
-                    if not nf_check_result:
+        for sensor_plan in plan.sensor_plans:
+            name = sensor_plan.sensor_name
+            sensor_path = os.path.join(self.path, name)
+            sensor_report = {'Folder_Checking': {}, 'File_Checking': {}}
+
+            # Checks that read nothing from the recorded files do not load the sensor folder,
+            # the others only load the entries they require
+            stage_start = time.perf_counter()
+            start_bytes = read_bytes_count()
+            sensor_data = self.data_cache.load(sensor_path, sensor_plan.requires) if sensor_plan.needs_data else {}
+            loading_bytes += read_bytes_count() - start_bytes
+            stages['data_loading_s'] += time.perf_counter() - stage_start
+            if sensor_plan.needs_data and not sensor_data:
+                continue
+            self.data = sensor_data
+            self.excel_report[name] = {}
+
+            # Level 1: Folder Checking
+            stage_start = time.perf_counter()
+            for check_class in sensor_plan.folder_checks:
+                check = check_class.create(self.data, sensor_path, data_cache=self.data_cache)
+                check_result = check.measured_run()
+                if not check_result:
+                    sensor_check_result = False
+                self._record(check, check_class.report_name(name), check_result, sensor_report['Folder_Checking'], self.excel_report[name])
+                self._record_metrics(check, check_class.report_name(name), 'folder', name)
+                self._record_performance(check, check_class.report_name(name), name)
+            stages['folder_checks_s'] += time.perf_counter() - stage_start
+
+            if sensor_plan.folder_checks:
+                self.report['Sensors_checking'][name] = {'Status': sensor_check_result}
+                self.report['Sensors_checking'][name]['Checkers'] = sensor_report
+                self.result = sensor_check_result
+
+            if not sensor_plan.file_checks:
+                continue
+
+            # The sibling sensors are loaded here, not from the check threads
+            stage_start = time.perf_counter()
+            start_bytes = read_bytes_count()
+            for sibling_name in sensor_plan.sibling_sensors:
+                self.data_cache.load(os.path.join(self.path, sibling_name), ('meta', 'txt'))
+            loading_bytes += read_bytes_count() - start_bytes
+            stages['data_loading_s'] += time.perf_counter() - stage_start
+
+            # Level 2: File Checking
+            stage_start = time.perf_counter()
+            for file_name in self.data:
+                sensor_report['File_Checking'][file_name] = {}
+                checks = [check_class.create(self.data, sensor_path, file_name, self.data_cache) for check_class in sensor_plan.file_checks]
+                check_results = self._run_checks(checks)
+
+                for check_class, check, check_result in zip(sensor_plan.file_checks, checks, check_results):
+                    if not check_result:
                         sensor_check_result = False
+                    self._record(check, check_class.report_name(name), check_result, sensor_report['File_Checking'][file_name], self.excel_report[name])
+                    self._record_metrics(check, check_class.report_name(name), 'file', name, file_name)
+                    self._record_performance(check, check_class.report_name(name), name, file_name)
 
-                    sensor_report['Folder_Checking']['NumberOfFilesCheck'] = (num_files_check.light_serialize() if self.light_mode else num_files_check.detailed_serialize())
-                    self.excel_report[name] = {'NumberOfFilesCheck': bool(nf_check_result)}
+                # Reporting
+                self.report['Sensors_checking'][name] = {'Status': sensor_check_result}
+                self.report['Sensors_checking'][name]['Checkers'] = sensor_report
+                self.result = sensor_check_result
+            stages['file_checks_s'] += time.perf_counter() - stage_start
 
-                    # UnexpectedFileCheck
-                    tf_check = UnexpectedFileCheck(self.data, os.path.join(self.path, name))
-                    tf_check_res = tf_check.run()
-                    if not tf_check_res:
-                        sensor_check_result = False
+        self.data_cache.clear()
+        self.performance['stage_read_bytes']['data_loading_s'] = loading_bytes
+        stages['total_s'] = time.perf_counter() - run_start
 
-                    sensor_report['Folder_Checking']['UnexpectedFileCheck'] = (tf_check.light_serialize() if self.light_mode else tf_check.detailed_serialize())
-                    self.excel_report[name]['UnexpectedFileCheck'] = tf_check_res
+        # Saving overall report for storing new data:
 
-                    # EmptyFilescheck
-                    ef_check = EmptyFilesCheck(self.data, os.path.join(self.path, name))
-                    ef_check_res = ef_check.run()
-                    if not ef_check_res:
-                        sensor_check_result = False
+        return self.result ,self.report, self.excel_report
 
+    def _run_checks(self, checks: list) -> list:
+        #""!
+        #brief Run independent checks, concurrently when 'check_threads' > 1.
 
-                    sensor_report['Folder_Checking']['EmptyFilesCheck'] = (ef_check.light_serialize() if self.light_mode else ef_check.detailed_serialize())
-                    self.excel_report[name]['EmptyFilesCheck'] = ef_check_res
-                    
-                    # Level 2: File Checking
-                    for file_name in self.data:
-                        sensor_report['File_Checking'][file_name] = {}
-                        
-                        # ir_depth_frame_number_consistency_check for: Kinect Sensor
-                        if name == 'depth.kinect':
-                            frm_num_consis_check = IrDepthFrameNumberConsistencyCheck(self.data, file_name, os.path.join(self.path, name), os.path.join(self.path, 'ir.kinect'))
-                            frm_num_consis_check_result = frm_num_consis_check.run()
-                            if not frm_num_consis_check_result:
-                                sensor_check_result = False
-                    
-                            sensor_report['File_Checking'][file_name]['kinect_ir_depth_frame_number_consistency_check'] = (frm_num_consis_check.light_serialize() if self.light_mode else frm_num_consis_check.detailed_serialize())
-                            self.excel_report[name]['kinect_ir_depth_frame_number_consistency_check'] = frm_num_consis_check_result
-                    
-                        # ir_depth_frame_number_consistency_check for: Flexx2 Sensor
-                        if name == 'depth.flexx2':
-                            frm_num_consis_check = IrDepthFrameNumberConsistencyCheck(self.data, file_name, os.path.join(self.path, name), os.path.join(self.path, 'ir.flexx2'))
-                            frm_num_consis_check_result = frm_num_consis_check.run()
-                            if not frm_num_consis_check_result:
-                                sensor_check_result = False
-                    
-                            sensor_report['File_Checking'][file_name]['flexx2_ir_depth_frame_number_consistency_check'] = (frm_num_consis_check.light_serialize() if self.light_mode else frm_num_consis_check.detailed_serialize())
-                            self.excel_report[name]['flexx2_ir_depth_frame_number_consistency_check'] = frm_num_consis_check_result
-
-                        
-                        # ir_depth_timestamp_consistency_check for: Flexx2 Sensor
-                        if name == 'depth.flexx2':
-                            timstmp_consis_check = IrDepthTimestampsConsistencyCheck(self.data, file_name, os.path.join(self.path, name), os.path.join(self.path, 'ir.flexx2'))
-                            timstmp_consis_check_result = timstmp_consis_check.run()
-                            if not timstmp_consis_check_result:
-                                sensor_check_result = False
-                    
-                            sensor_report['File_Checking'][file_name]['flexx2_ir_depth_timestamps_consistency_check'] = (timstmp_consis_check.light_serialize() if self.light_mode else timstmp_consis_check.detailed_serialize())
-                            self.excel_report[name]['flexx2_ir_depth_timestamps_consistency_check'] = timstmp_consis_check_result
-
-                        # ir_depth_timestamp_consistency_check for: Kinect Sensor
-                        if name == 'depth.kinect':
-                            timstmp_consis_check = IrDepthTimestampsConsistencyCheck(self.data, file_name, os.path.join(self.path, name), os.path.join(self.path, 'ir.kinect'))
-                            timstmp_consis_check_result = timstmp_consis_check.run()
-                            if not timstmp_consis_check_result:
-                                sensor_check_result = False
-                    
-                            sensor_report['File_Checking'][file_name]['kinect_ir_depth_timestamps_consistency_check'] = (timstmp_consis_check.light_serialize() if self.light_mode else timstmp_consis_check.detailed_serialize())
-                            self.excel_report[name]['kinect_ir_depth_timestamps_consistency_check'] = timstmp_consis_check_result
-
-                        # RawSizeCheck
-                        RawSize_check = RawSizeCheck(self.data[file_name], os.path.join(self.path, name))
-                        RawSize_check_res = RawSize_check.run()
-                        if not RawSize_check_res:
-                            sensor_check_result = False
-
-                        sensor_report['File_Checking'][file_name]['RawSizeCheck'] = RawSize_check.light_serialize() if self.light_mode else RawSize_check.detailed_serialize()
-                        self.excel_report[name]['RawSizeCheck'] = RawSize_check_res
-                    
-                        # NumberOfFramesCheck
-                        if name != "thermal.lepton":
-                            nframe_check = NumberOfFramesCheck(self.data[file_name], os.path.join(self.path, name))
-                            nframe_check_res = nframe_check.run()
-                            if not nframe_check_res:
-                                sensor_check_result = False
-                    
-                            sensor_report['File_Checking'][file_name]['NumberOfFramesCheck'] = (nframe_check.light_serialize() if self.light_mode else nframe_check.detailed_serialize())
-                            self.excel_report[name]['NumberOfFramesCheck'] = bool(nframe_check_res)
-
-                        # VRecordDurationCheck
-                        rec_drt_check = VRecordDurationCheck(self.data[file_name], os.path.join(self.path, name))
-                        rec_drt_check_res = rec_drt_check.run()
-                        if not rec_drt_check_res:
-                            sensor_check_result = False
-
-                        sensor_report['File_Checking'][file_name]['VRecordDurationCheck'] = (rec_drt_check.light_serialize() if self.light_mode else rec_drt_check.detailed_serialize())
-                        self.excel_report[name]['VRecordDurationCheck'] = rec_drt_check_res
-
-                        # AbnormalFrameDurationCheck
-                        abn_frm_drt_check = AbnormalFrameDurationCheck(self.data[file_name], os.path.join(self.path, name))
-                        abn_frm_drt_check_res = abn_frm_drt_check.run()
-                        if not abn_frm_drt_check_res:
-                            sensor_check_result = False
-
-                        sensor_report['File_Checking'][file_name]['AbnormalFrameDurationCheck'] = (abn_frm_drt_check.light_serialize() if self.light_mode else abn_frm_drt_check.detailed_serialize())
-                        self.excel_report[name]['AbnormalFrameDurationCheck'] = abn_frm_drt_check_res
-
-                        # GrowingMonotonicallyCheck
-                        growmono_check = GrowingMonotonicallyCheck(self.data[file_name], os.path.join(self.path, name))
-                        growmono_check_res = growmono_check.run()
-                        if not growmono_check_res:
-                            sensor_check_result = False
-
-                        sensor_report['File_Checking'][file_name]['GrowingMonotonicallyCheck'] = (growmono_check.light_serialize() if self.light_mode else growmono_check.detailed_serialize())
-                        self.excel_report[name]['GrowingMonotonicallyCheck'] = growmono_check_res
-
-                        # Reporting
-                        self.report['Sensors_checking'][name] = {'Status': sensor_check_result}
-                        self.report['Sensors_checking'][name]['Checkers'] = sensor_report
-                        self.result = sensor_check_result
+        #return: The results of the checks, in the same order.
+        #""
+        if self.check_threads > 1 and len(checks) > 1:
+            with ThreadPoolExecutor(max_workers=self.check_threads) as executor:
+                return list(executor.map(lambda check: check.measured_run(), checks))
+        return [check.measured_run() for check in checks]
 
+    def _record(self, check: Check, report_name: str, check_result, report: dict, excel_report: dict):
+        #""!
+        #brief Store the serialized check in the JSON report and its result in the Excel report.
+        #""
+        report[report_name] = check.light_serialize() if self.light_mode else check.detailed_serialize()
+        excel_report[report_name] = bool(check_result)
 
-        # Saving overall report for storing new data:
+    def _record_metrics(self, check: Check, report_name: str, level: str, sensor_name: str = None, file_name: str = None):
+        #""!
+        #brief Store the detailed serialization of the check in 'check_records', when they are collected.
+        #""
+        if self.check_records is not None:
+            self.check_records.append({'record': 'check', 'level': level, 'sensor': sensor_name, 'file': file_name,
+                                       'check': report_name} | check.detailed_serialize())
 
-        return self.result ,self.report, self.excel_report
+    def _record_performance(self, check: Check, report_name: str, sensor_name: str, file_name: str = None):
+        #""!
+        #brief Store the resource usage measured by 'measured_run' in the performance report.
+        #""
+        self.performance['checks'].append({'sensor': sensor_name, 'file': file_name, 'check': report_name} | check.performance)
     
 # @} ##
\ No newline at end of file
@@ -13,11 +13,15 @@ This class utilizes the `openpyxl` and `pandas` libraries to create, manipulate,
 
 try:
     from openpyxl import Workbook, load_workbook
+    from openpyxl.cell import WriteOnlyCell
+    from copy import copy
     from openpyxl.styles import PatternFill, Border, Side, Alignment,NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
     from openpyxl.utils.dataframe import dataframe_to_rows
     import os
     import openpyxl.utils
     import pandas as pd
+    from check_levels import CHECK_REGISTRY
 except ImportError as e:
     print(f"Error: {e}")
     exit(1)
@@ -29,14 +33,43 @@ class ExcelGenerator:
     Methods:
     - `__init__(excel_path: str)`: Initializes the ExcelGenerator class.
     - `creating_directory()`: Ensures the existence of the directory for the Excel file.
-    - `remove_default_sheet()`: Removes the default 'Sheet' from the Excel file.
-    - `create_or_load_workbook()`: Creates a new workbook or loads an existing one.
+    - `remove_default_sheet()`: Removes the default 'Sheet' from the in-memory workbook.
+    - `create_or_load_workbook()`: Creates a new workbook or loads an existing one, once per session.
+    - `save()`: Writes the in-memory workbook to the Excel file.
     - `convert_data_to_excel(workbook, report: dict, name: str)`: Converts data to an Excel sheet.
     - `design_excel()`: Enhances Excel file readability through formatting.
+    - `register_named_styles(workbook)`: Registers the named styles of the report sheets in a workbook.
+    - `design_sheet(sheet, num_columns: int)`: Formats one report sheet.
+    - `style_cells(sheet)`: Colors the check results of one report sheet with the named styles.
+    - `label_check_levels(sheet)`: Labels the rows of each check level of one report sheet.
     - `run(report: dict, name: str)`: Processes and saves a report for a specific sensor type.
+    - `collect_false_checks(sheet, name: str)`: Records the failed checks of one report sheet.
     - `create_summary_sheet()`: Creates a summary sheet aggregating false checks.
+    - `fill_summary_sheet(summary_sheet)`: Writes and styles the Summary content.
     - `rearrange_critical_rows()`: Rearranges critical rows based on predefined criteria.
+    - `rearrange_sheet_rows(sheet)`: Rearranges the critical rows of one sheet.
+
+    @note All the sheets, the styling and the Summary are built in memory; the .xlsx file is written only by `save()`.
     """
+
+    ## Fill color (start, end), border side and centering of each named style of the report sheets
+    REPORT_STYLES = {
+        'report_false': (("FF7F7F", "FF7F7F"), 'medium', True),
+        'report_true': (("90EE90", "90EE90"), 'medium', True),
+        'report_value': (("FFE87C", "FFFF00"), 'thin', True),
+        # Check names of the rows with a failed check, by style of the name cell itself
+        'report_false_key': (("FF0000", "FF0000"), 'medium', True),
+        'report_value_key': (("FF0000", "FF0000"), 'thin', True),
+        'report_key': (("FF0000", "FF0000"), None, False),
+        'report_header': (("FFFF00", "FFFF00"), 'medium', True),
+    }
+    ## Style of the check name of a row with a failed check, given the style of the name cell
+    KEY_STYLES = {'report_false': 'report_false_key', 'report_true': 'report_false_key',
+                  'report_value': 'report_value_key', None: 'report_key'}
+    ## Checks whose rows are moved to the end of the sheet by `rearrange_sheet_rows`, labelled as level 2
+    CRITICAL_CHECKS = ('NumberOfFramesCheck',
+                       'flexx2_ir_depth_frame_number_consistency_check', 'flexx2_ir_depth_timestamps_consistency_check',
+                       'kinect_ir_depth_frame_number_consistency_check', 'kinect_ir_depth_timestamps_consistency_check')
     
     def __init__(self, excel_path: str):
         """!
@@ -47,6 +80,7 @@ class ExcelGenerator:
         self.excel_file_path = f"{excel_path}_Excel_Report.xlsx"
         self.false_check = {}
         self.df = None
+        self.workbook = None
         self.creating_directory()
 
     def creating_directory(self):
@@ -58,30 +92,33 @@ class ExcelGenerator:
 
     def remove_default_sheet(self):
         """
-        @brief Removes the default 'Sheet' from the Excel file.
+        @brief Removes the default 'Sheet' from the in-memory workbook.
         """
 
-        try:
-            workbook = load_workbook(self.excel_file_path)
-            if 'Sheet' in workbook.sheetnames:
-                workbook.remove(workbook['Sheet'])
-                workbook.save(self.excel_file_path)
-        except :
-            pass  # No need to remove if the file doesn't exist yet
+        if 'Sheet' in self.workbook.sheetnames:
+            self.workbook.remove(self.workbook['Sheet'])
 
     def create_or_load_workbook(self):
         """
         @brief Creates a new workbook or loads an existing one.
+
+        The file is read only on the first call, later calls return the same in-memory workbook.
         """
 
+        if self.workbook is None:
+            try:
+                self.workbook = load_workbook(self.excel_file_path)
+            except :
+                self.workbook = Workbook()
+            self.remove_default_sheet()
+        return self.workbook
 
-        self.remove_default_sheet()
-        try:
-            workbook = load_workbook(self.excel_file_path)
-        except :
-            workbook = Workbook()
-            workbook.save(self.excel_file_path)
-        return workbook
+    def save(self):
+        """
+        @brief Writes the in-memory workbook to the Excel file.
+        """
+
+        self.create_or_load_workbook().save(self.excel_file_path)
 
     def convert_data_to_excel(self,workbook, report: dict, name: str):
         """
@@ -93,7 +130,8 @@ class ExcelGenerator:
         sheet = workbook.create_sheet(title=name)
         self.df = pd.DataFrame.from_dict(report)
         for r in dataframe_to_rows(self.df, index=True, header=True):
-            sheet.append(r)
+            # Missing checks come as NaN, store them as empty cells
+            sheet.append([None if isinstance(value, float) and value != value else value for value in r])
         return workbook
     
     def design_excel(self) :
@@ -101,83 +139,154 @@ class ExcelGenerator:
         @brief Formats the Excel sheet with color-coding and styling.
         """
 
-        workbook = load_workbook(self.excel_file_path)
+        workbook = self.create_or_load_workbook()
 
         # Select the active sheet
         for sheet_name in workbook.sheetnames:
             if sheet_name != "Summary":
-                sheet = workbook[sheet_name]
-                # Add a new column at the beginning
-                
-                sheet.insert_cols(1)
-
-                sheet.merge_cells('A3:A4')
-                sheet['A3'] = 'Root check'
-                sheet['D3'].value = sheet['C3'].value
-                sheet['D4'].value = sheet['C4'].value
-                sheet.delete_cols(3)
-
-                last_column_index = sheet.max_column
-
-                # Define the range to merge (from C3 to the last column in row 3)
-                merge_range = f'C3:{chr(ord("C") + last_column_index-3)}3'
-
-                # Merge cells
-                sheet.merge_cells(merge_range)
-
-                # Define the range to merge (from C4 to the last column in row 4)
-                merge_range = f'C4:{chr(ord("C") + last_column_index-3)}4'
-                sheet.merge_cells(merge_range)
-
-                sheet.column_dimensions['A'].width = 18
-
-                sheet.merge_cells('A5:A11')
-                sheet['A5'] = 'Sensors check (L1)'
-
-                sheet.merge_cells('A16:A18')
-                sheet['A16'] = 'Sensors check (L2)'                
-
-                cells_widths = 20
-                cells_heights = 30
-                for col in range(2, len(self.df.columns) + 3):
-                    column_letter = openpyxl.utils.get_column_letter(col)
-                    sheet.column_dimensions[column_letter].width = cells_widths
-
-                border_style = Side(style='medium', color='000000')
-                border_style2 = Side(style='thin', color='000000')
-
-                for row in sheet.iter_rows():
-                    for cell in row:
-                        if cell.value == False:
-                            cell.fill = PatternFill(start_color="FF7F7F", end_color="FF7F7F", fill_type='solid')
-                            row[1].fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type='solid')
-                            cell.border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-                            sheet.row_dimensions[cell.row].height = cells_heights
-                            cell.alignment = Alignment(horizontal='center', vertical='center')
-                        elif cell.value == True:
-                            cell.fill = PatternFill(start_color="90EE90", end_color="90EE90", fill_type='solid')
-                            cell.border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-                            sheet.row_dimensions[cell.row].height = cells_heights
-                            cell.alignment = Alignment(horizontal='center', vertical='center')
-                        elif cell.value is not None and cell.value != "":
-                            cell.fill = PatternFill(start_color="FFE87C", end_color="FFFF00", fill_type='solid')
-                            cell.border = Border(left=border_style2, right=border_style2, top=border_style2, bottom=border_style2)
-                            cell.alignment = Alignment(horizontal='center', vertical='center')
-                            sheet.row_dimensions[cell.row].height = cells_heights
-
-                sheet['B1'] = 'Name of the Sensors  -> '
-                sheet['B1'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type='solid')
-                sheet['B1'].border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-                sheet['B1'].alignment = Alignment(horizontal='center', vertical='center')
-
-                sheet['A2'] = 'Level of Checks'
-                sheet['A2'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type='solid')
-                sheet['A2'].border = Border(left=border_style, right=border_style, top=border_style, bottom=border_style)
-                sheet['A2'].alignment = Alignment(horizontal='center', vertical='center')
-
-                sheet.column_dimensions['B'].width = 50
-
-        workbook.save(self.excel_file_path)
+                self.design_sheet(workbook[sheet_name], len(self.df.columns))
+
+    def register_named_styles(self, workbook):
+        """
+        @brief Registers the named styles of the report sheets in a workbook, once.
+
+        Assigning a registered style to a cell only copies its style indexes, instead of
+        looking up a new fill, border and alignment for every cell.
+
+        @param workbook: The workbook holding the report sheets.
+        """
+
+        for style_name, ((start_color, end_color), border_side, centered) in self.REPORT_STYLES.items():
+            if style_name in workbook.named_styles:
+                continue
+            # The styles are bound to their workbook, so each workbook gets its own objects
+            style = NamedStyle(name=style_name, font=copy(DEFAULT_FONT))
+            style.fill = PatternFill(start_color=start_color, end_color=end_color, fill_type='solid')
+            if border_side:
+                side = Side(style=border_side, color='000000')
+                style.border = Border(left=side, right=side, top=side, bottom=side)
+            if centered:
+                style.alignment = Alignment(horizontal='center', vertical='center')
+            workbook.add_named_style(style)
+
+    def design_sheet(self, sheet, num_columns: int):
+        """
+        @brief Formats one report sheet with color-coding and styling.
+
+        @param sheet: The worksheet holding the report of one recording folder.
+        @param num_columns (int): The number of sensor columns of the report.
+        """
+
+        # Add a new column at the beginning
+        
+        sheet.insert_cols(1)
+
+        sheet['D3'].value = sheet['C3'].value
+        sheet['D4'].value = sheet['C4'].value
+        sheet.delete_cols(3)
+
+        last_column_index = sheet.max_column
+
+        # Define the range to merge (from C3 to the last column in row 3)
+        merge_range = f'C3:{chr(ord("C") + last_column_index-3)}3'
+
+        # Merge cells
+        sheet.merge_cells(merge_range)
+
+        # Define the range to merge (from C4 to the last column in row 4)
+        merge_range = f'C4:{chr(ord("C") + last_column_index-3)}4'
+        sheet.merge_cells(merge_range)
+
+        sheet.column_dimensions['A'].width = 18
+
+        self.label_check_levels(sheet)
+
+        cells_widths = 20
+        for col in range(2, num_columns + 3):
+            column_letter = openpyxl.utils.get_column_letter(col)
+            sheet.column_dimensions[column_letter].width = cells_widths
+
+        self.style_cells(sheet)
+
+        sheet.column_dimensions['B'].width = 50
+
+    def style_cells(self, sheet):
+        """
+        @brief Colors the check results of one report sheet and styles its headers.
+
+        Each cell gets the registered named style of its category (False, True or other value),
+        and the height of a row is set once.
+
+        @param sheet: The worksheet holding the report of one recording folder.
+        """
+
+        cells_heights = 30
+        self.register_named_styles(sheet.parent)
+
+        for row in sheet.iter_rows():
+            row_styles = []
+            for cell in row:
+                if cell.value == False:
+                    row_styles.append('report_false')
+                elif cell.value == True:
+                    row_styles.append('report_true')
+                elif cell.value is not None and cell.value != "":
+                    row_styles.append('report_value')
+                else:
+                    row_styles.append(None)
+            if not any(row_styles):
+                continue
+
+            sheet.row_dimensions[row[0].row].height = cells_heights
+            for cell, style_name in zip(row, row_styles):
+                if style_name:
+                    cell.style = style_name
+            # A failed check highlights the name of the check
+            if 'report_false' in row_styles:
+                row[1].style = self.KEY_STYLES[row_styles[1]]
+
+        sheet['B1'] = 'Name of the Sensors  -> '
+        sheet['B1'].style = 'report_header'
+
+        sheet['A2'] = 'Level of Checks'
+        sheet['A2'].style = 'report_header'
+
+    def label_check_levels(self, sheet):
+        """
+        @brief Labels the rows of each check level in the first column of one report sheet.
+
+        The root checks (scope 'root' in `CHECK_REGISTRY`) are labelled 'Root check', the critical
+        checks moved to the end of the sheet 'Sensors check (L2)' and the other sensor checks
+        'Sensors check (L1)'. The label is merged over each run of consecutive rows of the same level.
+
+        @param sheet: The worksheet holding the report of one recording folder.
+        """
+
+        check_levels = {}
+        for check_class in CHECK_REGISTRY:
+            for sensor_name in check_class.sensors or (None,):
+                report_name = check_class.report_name(sensor_name)
+                if check_class.scope == 'root':
+                    check_levels[report_name] = 'Root check'
+                elif report_name in self.CRITICAL_CHECKS:
+                    check_levels[report_name] = 'Sensors check (L2)'
+                else:
+                    check_levels[report_name] = 'Sensors check (L1)'
+
+        level_runs = []
+        for row in range(1, sheet.max_row + 1):
+            level = check_levels.get(sheet.cell(row=row, column=2).value)
+            if level is None:
+                continue
+            if level_runs and level_runs[-1][0] == level and level_runs[-1][2] == row - 1:
+                level_runs[-1][2] = row
+            else:
+                level_runs.append([level, row, row])
+
+        for level, first_row, last_row in level_runs:
+            if last_row > first_row:
+                sheet.merge_cells(f'A{first_row}:A{last_row}')
+            sheet[f'A{first_row}'] = level
 
     def run(self, report: dict, name: str):
         """
@@ -186,7 +295,6 @@ class ExcelGenerator:
         @param report (dict): The data dictionary to be processed.
         @param name (str): The name of the sensor type.
         """
-        self.false_check[name] = {}
         # Load existing or create a new workbook
         workbook = self.create_or_load_workbook()
         # Check if the sheet already exists with the same name
@@ -195,27 +303,41 @@ class ExcelGenerator:
             workbook.remove(workbook[name])
 
         workbook = self.convert_data_to_excel(workbook, report, name)
-        sheet = workbook[name]
-        
+        self.collect_false_checks(workbook[name], name)
+
+    def collect_false_checks(self, sheet, name: str):
+        """
+        @brief Records, for the Summary, which checks of a report sheet have failed.
+
+        @param sheet: The worksheet holding the report of one recording folder.
+        @param name (str): The name of the recording folder.
+        """
+        self.false_check[name] = {}
         for row in sheet.iter_rows():
             self.false_check[name][row[0].value] = True
             for cell in row:
                 if cell.value is False:
                     self.false_check[name][row[0].value] = False 
         self.false_check[name].pop(None)
-        # Save changes to the Excel file
-        workbook.save(self.excel_file_path)
 
     def create_summary_sheet(self):
         """
         @brief Creates a summary sheet aggregating false checks.
         """
 
-        workbook = load_workbook(self.excel_file_path)
+        workbook = self.create_or_load_workbook()
         if "Summary" in workbook.sheetnames:
             # Delete the existing sheet with the same name
             workbook.remove(workbook["Summary"])
         summary_sheet = workbook.create_sheet(title="Summary", index=0)
+        self.fill_summary_sheet(summary_sheet)
+
+    def fill_summary_sheet(self, summary_sheet):
+        """
+        @brief Writes and styles the aggregated false checks in the given sheet.
+
+        @param summary_sheet: The empty worksheet used as Summary.
+        """
         df = pd.DataFrame.from_dict(self.false_check)
         
         for r in dataframe_to_rows(df, index=True, header=True):
@@ -239,67 +361,161 @@ class ExcelGenerator:
                 cell.alignment = Alignment(horizontal='center', vertical='center')
         summary_sheet.column_dimensions['A'].width = 50
 
-        workbook.save(self.excel_file_path)
-
     def rearrange_critical_rows(self):
         """
         @brief Rearranges critical rows based on predefined criteria.
         """
 
-        # Load the Excel file
-        workbook = load_workbook(self.excel_file_path)
+        workbook = self.create_or_load_workbook()
 
         # Select the active sheet
         for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-
-            # Extract the critical rows and rearrange them (replace with your logic)
-            important_rows = []
-
-            for row in range(1, sheet.max_row + 1):
-                if (
-                    sheet.cell(row=row, column=1).value == 'NumberOfFramesCheck'
-
-                ):
-                    important_rows.append(sheet[row])
-                    sheet.delete_rows(row)
-
-                if (
-                    sheet.cell(row=row, column=2).value == 'NumberOfFramesCheck'
-                ):
-                    important_rows.append(sheet[row])
-                    sheet.delete_rows(row)
-
-            
-                # Perform your logic to identify important rows
-                # For example, let's say rows with certain criteria are considered important
-            for row in range(1, sheet.max_row + 1):
-                if (
-                    sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_frame_number_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_timestamps_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_frame_number_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_timestamps_consistency_check'
-
-                ):
-                    important_rows.append(sheet[row])
-                    sheet.delete_rows(row)
-
-                if (
-                    sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_frame_number_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_timestamps_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_frame_number_consistency_check'
-                    or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_timestamps_consistency_check'
-                ):
-                    important_rows.append(sheet[row])
-                    sheet.delete_rows(row)
-
-            # Rearrange the important rows in a specific order (replace with your logic)
-            # For example, moving critical rows to the top of the sheet
-            sheet.append([])
-            for row_data in important_rows:
-                sheet.append(row_data)
-
-        # Save the modified workbook
-        workbook.save(self.excel_file_path)
+            self.rearrange_sheet_rows(workbook[sheet_name])
+
+    def rearrange_sheet_rows(self, sheet):
+        """
+        @brief Moves the critical rows of one sheet to its end.
+
+        @param sheet: The worksheet holding the report of one recording folder.
+        """
+
+        # Extract the critical rows and rearrange them (replace with your logic)
+        important_rows = []
+
+        for row in range(1, sheet.max_row + 1):
+            if (
+                sheet.cell(row=row, column=1).value == 'NumberOfFramesCheck'
+
+            ):
+                important_rows.append(sheet[row])
+                sheet.delete_rows(row)
+
+            if (
+                sheet.cell(row=row, column=2).value == 'NumberOfFramesCheck'
+            ):
+                important_rows.append(sheet[row])
+                sheet.delete_rows(row)
+
+        
+            # Perform your logic to identify important rows
+            # For example, let's say rows with certain criteria are considered important
+        for row in range(1, sheet.max_row + 1):
+            if (
+                sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_frame_number_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_timestamps_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_frame_number_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_timestamps_consistency_check'
+
+            ):
+                important_rows.append(sheet[row])
+                sheet.delete_rows(row)
+
+            if (
+                sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_frame_number_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'flexx2_ir_depth_timestamps_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_frame_number_consistency_check'
+                or sheet.cell(row=row, column=1).value == 'kinect_ir_depth_timestamps_consistency_check'
+            ):
+                important_rows.append(sheet[row])
+                sheet.delete_rows(row)
+
+        # Rearrange the important rows in a specific order (replace with your logic)
+        # For example, moving critical rows to the top of the sheet
+        sheet.append([])
+        for row_data in important_rows:
+            sheet.append(row_data)
+
+
+class StreamingExcelGenerator(ExcelGenerator):
+    """!
+    @brief Excel backend writing the report with openpyxl write-only mode.
+
+    Each recording folder is laid out and styled in a scratch one-sheet workbook (using the same
+    `rearrange_sheet_rows()` and `design_sheet()` steps as `ExcelGenerator`) and its rows are then
+    streamed, with fills, borders, merges and dimensions applied, to the output workbook.
+    Only one folder is kept as cell objects at a time, so memory stays flat however many folders are inspected.
+
+    @note The output file is always written from scratch, an existing report is not loaded.
+    """
+
+    def __init__(self, excel_path: str):
+        """!
+        @brief Initializes the StreamingExcelGenerator class.
+
+        @param excel_path (str): The path where the Excel report should be saved.
+        """
+        super().__init__(excel_path)
+        self.workbook = Workbook(write_only=True)
+        # Created first so that it is the first sheet, its rows are written by create_summary_sheet()
+        self.summary_sheet = self.workbook.create_sheet(title="Summary")
+
+    def run(self, report: dict, name: str):
+        """
+        @brief Lays out, styles and streams the report of one recording folder.
+
+        @param report (dict): The data dictionary to be processed.
+        @param name (str): The name of the recording folder.
+        """
+        scratch_workbook = self.convert_data_to_excel(Workbook(), report, name)
+        sheet = scratch_workbook[name]
+        self.collect_false_checks(sheet, name)
+        self.rearrange_sheet_rows(sheet)
+        self.design_sheet(sheet, len(self.df.columns))
+        self.stream_sheet(sheet, self.workbook.create_sheet(title=name))
+
+    def stream_sheet(self, sheet, output_sheet):
+        """
+        @brief Copies a styled sheet into a write-only sheet.
+
+        Column widths, row heights and merges have to be set before the rows are written.
+
+        @param sheet: The styled scratch worksheet.
+        @param output_sheet: The write-only worksheet of the output workbook.
+        """
+        for column_letter, dimension in sheet.column_dimensions.items():
+            output_sheet.column_dimensions[column_letter].width = dimension.width
+        for row_index, dimension in sheet.row_dimensions.items():
+            if dimension.height is not None:
+                output_sheet.row_dimensions[row_index].height = dimension.height
+        for merged_range in sheet.merged_cells.ranges:
+            output_sheet.merged_cells.add(str(merged_range))
+
+        for row in sheet.iter_rows():
+            output_row = []
+            for cell in row:
+                output_cell = WriteOnlyCell(output_sheet, value=cell.value)
+                if cell.has_style:
+                    output_cell.font = copy(cell.font)
+                    output_cell.fill = copy(cell.fill)
+                    output_cell.border = copy(cell.border)
+                    output_cell.alignment = copy(cell.alignment)
+                    output_cell.number_format = cell.number_format
+                output_row.append(output_cell)
+            output_sheet.append(output_row)
+
+    def rearrange_critical_rows(self):
+        """
+        @brief Nothing to do, the critical rows are rearranged in `run()` before streaming.
+        """
+
+    def design_excel(self):
+        """
+        @brief Nothing to do, each sheet is styled in `run()` before streaming.
+        """
+
+    def create_summary_sheet(self):
+        """
+        @brief Streams the summary sheet aggregating false checks.
+        """
+        scratch_workbook = Workbook()
+        summary_sheet = scratch_workbook.active
+        self.fill_summary_sheet(summary_sheet)
+        self.stream_sheet(summary_sheet, self.summary_sheet)
+
+    def save(self):
+        """
+        @brief Writes the streamed workbook to the Excel file.
+        """
+        self.workbook.save(self.excel_file_path)
 
 # @} ##
\ No newline at end of file
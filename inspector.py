@@ -22,11 +22,28 @@ try:
     import json
     import time
     from tqdm import tqdm
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    import hashlib
+    import csv
+    import gzip
     import os
 except ImportError as e:
     print(f"Error: {e}")
     exit(1)
 
+# Optional faster JSON encoder for the compact and JSON-lines reports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Parquet export of the check results, gzip CSV without it
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 # Import checkers class
 from check_levels import *
 from excel_generator import *
@@ -35,10 +52,24 @@ class ReportGenerator():
     """!
     @brief Generates detailed reports based on provided check data.
 
+    The report of a folder is written once its checks have finished, in one of the `REPORT_FORMATS`:
+    - `pretty`: Indented JSON document (default).
+    - `compact`: JSON document without whitespace, encoded by orjson when it is installed.
+    - `jsonl`: JSON lines, one record for the report details, for each status, for each check
+      of each file and for the performance; the report file gets the '.jsonl' extension.
+
+    The compact and JSON-lines files are encoded one section (or record) at a time, so the
+    document is never held as one encoded string; they make the files smaller and faster to
+    write, not the run lighter. The checks are not streamed to the file as they finish: they
+    may run in worker processes or come from the `InspectionIndex`, and the complete report of
+    the folder is also needed by the Excel report, the inspection index and the results export.
+
     Methods:
-    - `__init__(json_path: str, check_report_struct: dict, ret: bool, check_path)`: Initializes the ReportGenerator class.
+    - `__init__(json_path: str, check_report_struct: dict, ret: bool, check_path, performance=None, report_format='pretty')`: Initializes the ReportGenerator class.
     - `run()`: Executes the report generation process.
     - `report_detail_generate()`: Generates detailed report information.
+    - `dumps(value)`: Encodes a value in the compact or JSON-lines format.
+    - `check_records()`: Yields the JSON-lines records of the checks.
 
     Attributes:
     - `json_path`: The path where the JSON report should be saved.
@@ -48,9 +79,14 @@ class ReportGenerator():
     - `time`: The timestamp for report naming.
     - `overall_data`: Overall report information.
     - `result`: The check result.
+    - `performance`: Stage timings and resource usage of the checks, written in the 'Performance' section.
+    - `report_format`: The format of the report file.
 
     """
-    def __init__(self, json_path: str, check_report_struct: dict, ret: bool, check_path):
+
+    REPORT_FORMATS = ('pretty', 'compact', 'jsonl')
+
+    def __init__(self, json_path: str, check_report_struct: dict, ret: bool, check_path, performance=None, report_format='pretty'):
         """!
         @brief Initializes the ReportGenerator class.
 
@@ -58,14 +94,20 @@ class ReportGenerator():
         @param check_report_struct (dict): The structure of the check report.
         @param ret (bool): The check result.
         @param check_path: The path of the checked folder.
+        @param performance (dict): Stage timings and resource usage of the checks, None to leave out the 'Performance' section.
+        @param report_format (str): One of `REPORT_FORMATS`.
         """
-        self.json_path = json_path
+        if report_format not in self.REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {report_format}")
+        self.json_path = json_path + '.jsonl' if report_format == 'jsonl' else json_path
         self.check_path = check_path
         self.check_report = check_report_struct
         self.final_report = {}
         self.time = time_generator()
         self.overall_data = {}
         self.result = ret
+        self.performance = performance
+        self.report_format = report_format
         
 
     def run(self):
@@ -76,9 +118,61 @@ class ReportGenerator():
         self.report_detail_generate()
         self.final_report["Report Details"] = self.overall_data
         self.final_report["Checks"] = self.check_report
+        if self.performance is not None:
+            self.final_report["Performance"] = self.performance
         # Parsing the class check_report_struct
         with open(self.json_path, 'w') as file:
-            json.dump(self.final_report, file, indent=2)
+            if self.report_format == 'pretty':
+                json.dump(self.final_report, file, indent=2)
+            elif self.report_format == 'compact':
+                self.write_compact(file)
+            else:
+                self.write_records(file)
+
+    def dumps(self, value) -> str:
+        """!
+        @brief Encodes a value without whitespace, with orjson when it is installed.
+        """
+        if orjson is not None:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(value, separators=(',', ':'))
+
+    def write_compact(self, file):
+        """!
+        @brief Writes the compact JSON document, one section at a time.
+        """
+        file.write('{' + self.dumps("Report Details") + ':' + self.dumps(self.overall_data))
+        file.write(',' + self.dumps("Checks") + ':{')
+        for section_index, (section_name, section) in enumerate(self.check_report.items()):
+            file.write((',' if section_index else '') + self.dumps(section_name) + ':')
+            if section_name == 'Sensors_checking':
+                # One sensor folder at a time
+                file.write('{')
+                for sensor_index, (sensor_name, sensor_report) in enumerate(section.items()):
+                    file.write((',' if sensor_index else '') + self.dumps(sensor_name) + ':' + self.dumps(sensor_report))
+                file.write('}')
+            else:
+                file.write(self.dumps(section))
+        file.write('}')
+        if self.performance is not None:
+            file.write(',' + self.dumps("Performance") + ':' + self.dumps(self.performance))
+        file.write('}')
+
+    def check_records(self):
+        """!
+        @brief Yields one record per status and per check of each file of the check report.
+        """
+        return iter_check_records(self.check_report)
+
+    def write_records(self, file):
+        """!
+        @brief Writes the JSON-lines report, one record at a time.
+        """
+        file.write(self.dumps({'record': 'details'} | self.overall_data) + '\n')
+        for record in self.check_records():
+            file.write(self.dumps(record) + '\n')
+        if self.performance is not None:
+            file.write(self.dumps({'record': 'performance'} | self.performance) + '\n')
 
     def report_detail_generate(self):
         """!
@@ -90,6 +184,125 @@ class ReportGenerator():
         self.overall_data['Result'] = self.result
 
 
+def iter_check_records(check_report: dict):
+    """!
+    @brief Flattens a Checker report into one record per status and per check of each file.
+
+    @param check_report (dict): The JSON report returned by `Checker.run`.
+    @return Generator of dictionaries with the 'record' ('status' or 'check'), 'level' ('root', 'sensor',
+            'folder' or 'file'), 'sensor', 'file' and 'check' keys, followed by the serialized check.
+    """
+    root_report = check_report.get('Root_Checking', {})
+    if 'Status' in root_report:
+        yield {'record': 'status', 'level': 'root', 'sensor': None, 'Status': root_report['Status']}
+    for check_name, report in root_report.get('Checkers', {}).items():
+        yield {'record': 'check', 'level': 'root', 'sensor': None, 'file': None, 'check': check_name} | report
+
+    for sensor_name, sensor_report in check_report.get('Sensors_checking', {}).items():
+        yield {'record': 'status', 'level': 'sensor', 'sensor': sensor_name, 'Status': sensor_report.get('Status')}
+        checkers = sensor_report.get('Checkers', {})
+        for check_name, report in checkers.get('Folder_Checking', {}).items():
+            yield {'record': 'check', 'level': 'folder', 'sensor': sensor_name, 'file': None, 'check': check_name} | report
+        for file_name, file_report in checkers.get('File_Checking', {}).items():
+            for check_name, report in file_report.items():
+                yield {'record': 'check', 'level': 'file', 'sensor': sensor_name, 'file': file_name, 'check': check_name} | report
+
+
+class ResultsExporter():
+    """!
+    @brief Appends the flattened check results of every checked folder to a columnar results file.
+
+    One row is written per check of each file, with its metrics (the fields of `detailed_serialize`)
+    encoded as a JSON string, so the whole campaign can be loaded at once:
+    `pandas.read_parquet(results_path)` or `pandas.read_csv(results_path + '/results.csv.gz')`.
+
+    With pyarrow the results go to a Parquet dataset: each run adds a 'part-<time>-<pid>.parquet'
+    file to the `results_path` folder, with one row group per checked folder. Without pyarrow
+    they are appended to 'results.csv.gz' in the same folder.
+
+    Methods:
+    - `__init__(results_path: str, columnar=None)`: Initializes the ResultsExporter class.
+    - `rows(recording: str, session: str, check_report: dict, check_records=None)`: Flattens the results of one checked folder.
+    - `append(recording: str, session: str, check_report: dict, check_records=None)`: Writes the rows of one checked folder.
+    - `close()`: Finishes the results file of the run.
+
+    """
+
+    COLUMNS = ('recording', 'session', 'sensor', 'file', 'level', 'check', 'code', 'result', 'metrics')
+
+    def __init__(self, results_path: str, columnar=None):
+        """!
+        @brief Initializes the ResultsExporter class.
+
+        @param results_path (str): The folder receiving the results files.
+        @param columnar (bool): Write Parquet (True) or gzip CSV (False); Parquet when pyarrow is installed if None.
+        """
+        self.results_path = results_path
+        self.columnar = pyarrow is not None if columnar is None else columnar
+        if self.columnar and pyarrow is None:
+            raise ImportError("pyarrow is required for the Parquet results export")
+        os.makedirs(self.results_path, exist_ok=True)
+
+        self.writer = None
+        if self.columnar:
+            self.file_path = os.path.join(self.results_path, f'part-{time_generator()}-{os.getpid()}.parquet')
+            self.schema = pyarrow.schema([(column, pyarrow.bool_() if column == 'result' else pyarrow.string()) for column in self.COLUMNS])
+        else:
+            self.file_path = os.path.join(self.results_path, 'results.csv.gz')
+
+    def rows(self, recording: str, session: str, check_report: dict, check_records=None) -> list:
+        """!
+        @brief Flattens the results of one checked folder into rows of `COLUMNS`.
+
+        The metrics are taken from `check_records` when given (the detailed records collected by the Checker
+        in light mode), otherwise from the report itself.
+        """
+        rows = []
+        for record in check_records if check_records is not None else iter_check_records(check_report):
+            if record['record'] != 'check':
+                continue
+            metrics = {key: value for key, value in record.items()
+                       if key not in ('record', 'level', 'sensor', 'file', 'check', 'code', 'description', 'Result')}
+            rows.append({'recording': recording, 'session': session, 'sensor': record['sensor'], 'file': record['file'],
+                         'level': record['level'], 'check': record['check'], 'code': record.get('code'),
+                         'result': bool(record.get('Result')), 'metrics': json.dumps(metrics, default=str) if metrics else None})
+        return rows
+
+    def append(self, recording: str, session: str, check_report: dict, check_records=None):
+        """!
+        @brief Writes the rows of one checked folder.
+
+        @param recording (str): The name of the recording folder (e.g. '0001').
+        @param session (str): The name of the 6-digit session folder.
+        @param check_report (dict): The JSON report returned by `Checker.run`.
+        @param check_records (list): The detailed check records of the Checker (`Checker.check_records`), None to use the report.
+        """
+        rows = self.rows(recording, session, check_report, check_records)
+        if not rows:
+            return
+
+        if self.columnar:
+            if self.writer is None:
+                self.writer = pyarrow.parquet.ParquetWriter(self.file_path, self.schema)
+            self.writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+        else:
+            write_header = not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
+            # Every folder adds a gzip member to the file, readable as one stream
+            with gzip.open(self.file_path, 'at', newline='') as file:
+                writer = csv.DictWriter(file, fieldnames=self.COLUMNS)
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(rows)
+
+    def close(self):
+        """!
+        @brief Finishes the Parquet file of the run; nothing to do for the CSV file.
+        """
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
 # Preparing Recent Time
 def time_generator():
     nowtime = time.localtime()
@@ -110,12 +323,199 @@ def time_generator():
     return time_str
 
 
+def check_folder(check_path: str, light_mode: bool, only=None, check_threads=1, data_cache=None, collect_metrics=False):
+    """!
+    @brief Runs the Checker on one recording folder.
+
+    Defined at module level so it can be sent to the worker processes of `Inspector`.
+
+    @param check_path (str): The path of the 6-digit recording folder.
+    @param light_mode (bool): Flag to enable or disable light mode in reports.
+    @param only (list): Names of the checks to run, all the registered checks if None.
+    @param check_threads (int): Number of threads running the checks of one recorded file.
+    @param data_cache (SensorDataCache): Data of the folder already read by a `FolderPrefetcher`, None to read it here.
+    @param collect_metrics (bool): Keep the detailed records of the checks in light mode, for the results export.
+    @return Tuple containing the result, JSON report, Excel report, performance report and detailed check records
+            (None if not collected) of the folder.
+    """
+    checker = Checker(check_path, light_mode, only, check_threads, data_cache, collect_metrics)
+    return checker.run() + (checker.performance, checker.check_records)
+
+
+def prefetch_folder(check_path: str, only=None) -> SensorDataCache:
+    """!
+    @brief Reads the .txt and .meta files of a recording folder needed by the selected checks.
+
+    @param check_path (str): The path of the 6-digit recording folder.
+    @param only (list): Names of the checks to run, all the registered checks if None.
+    @return The SensorDataCache holding the parsed data, to be passed to `check_folder`.
+    """
+    data_cache = SensorDataCache()
+    data_cache.prefetch(check_path, only)
+    return data_cache
+
+
+class FolderPrefetcher():
+    """!
+    @brief Reads the next recording folders in background threads while the current one is checked.
+
+    At most `depth` folders are read ahead of the one being checked, so the memory used by the
+    prefetched data stays bounded.
+
+    Methods:
+    - `__init__(check_paths: list, depth: int, only=None)`: Starts reading the first `depth` folders.
+    - `take(index: int)`: Returns the data of the folder `check_paths[index]` and starts reading the next one.
+    - `shutdown()`: Cancels the pending reads.
+
+    """
+
+    def __init__(self, check_paths: list, depth: int, only=None):
+        """!
+        @brief Initializes the FolderPrefetcher class.
+
+        @param check_paths (list): The paths of the recording folders, in the order they are checked.
+        @param depth (int): The number of folders read ahead, also the number of reading threads.
+        @param only (list): Names of the checks to run, all the registered checks if None.
+        """
+        self.check_paths = check_paths
+        self.depth = max(1, int(depth))
+        self.only = only
+        self.executor = ThreadPoolExecutor(max_workers=self.depth)
+        self.futures = {}
+        for index in range(min(self.depth, len(check_paths))):
+            self._submit(index)
+
+    def _submit(self, index: int):
+        if index < len(self.check_paths) and index not in self.futures:
+            self.futures[index] = self.executor.submit(prefetch_folder, self.check_paths[index], self.only)
+
+    def take(self, index: int) -> SensorDataCache:
+        """!
+        @brief Returns the prefetched data of a folder, waiting for its read to finish.
+
+        @param index (int): The position of the folder in `check_paths`.
+        @return The SensorDataCache of the folder.
+        """
+        self._submit(index)
+        future = self.futures.pop(index)
+        self._submit(index + self.depth)
+        return future.result()
+
+    def shutdown(self):
+        """!
+        @brief Cancels the reads not started yet and waits for the running ones.
+        """
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        self.executor.shutdown()
+
+
+def folder_fingerprint(check_path: str, light_mode: bool, only=None, collect_metrics=False) -> str:
+    """!
+    @brief Computes a fingerprint of a recording folder from the size and mtime of its files.
+
+    The configuration settings, the light mode, the collection of the check records, the selected checks and
+    the registered checks with their code (`check_registry_key`) are part of the fingerprint, so a change of
+    thresholds, report mode or checks, or an upgrade of the checks, invalidates the cached results.
+
+    @param check_path (str): The path of the 6-digit recording folder.
+    @param light_mode (bool): Flag to enable or disable light mode in reports.
+    @param only (list): Names of the selected checks, None for all the registered checks.
+    @param collect_metrics (bool): Flag telling whether the detailed check records are collected.
+    @return The hexadecimal fingerprint.
+    """
+    fingerprint = hashlib.sha1()
+    fingerprint.update(json.dumps(set_config.config_data, sort_keys=True).encode())
+    fingerprint.update(str(bool(light_mode)).encode())
+    fingerprint.update(str(bool(collect_metrics and light_mode)).encode())
+    fingerprint.update(str(sorted(only) if only else None).encode())
+    fingerprint.update(check_registry_key().encode())
+
+    folders = [check_path]
+    while folders:
+        folder = folders.pop()
+        with os.scandir(folder) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                stat = entry.stat()
+                fingerprint.update(f"{os.path.relpath(entry.path, check_path)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+                if entry.is_dir():
+                    folders.append(entry.path)
+    return fingerprint.hexdigest()
+
+
+class InspectionIndex():
+    """!
+    @brief Persistent index of the checked recording folders.
+
+    The index is a JSON-lines file; each line stores the path and fingerprint of a folder together
+    with its Checker result, JSON report, Excel report and detailed check records. Folders whose fingerprint did not change
+    since the last run are not checked again, their stored results are reused.
+
+    Methods:
+    - `__init__(index_path: str)`: Loads the index file if it exists.
+    - `lookup(check_path: str, fingerprint: str)`: Returns the stored results of an unchanged folder.
+    - `store(check_path: str, fingerprint: str, check_result)`: Appends the results of a checked folder.
+    """
+
+    def __init__(self, index_path: str):
+        """!
+        @brief Loads the index file if it exists.
+
+        @param index_path (str): The path of the JSON-lines index file.
+        """
+        self.index_path = index_path
+        self.entries = {}
+
+        line_num = 0
+        if os.path.exists(self.index_path):
+            with open(self.index_path, 'r') as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Skip a line left incomplete by an interrupted run
+                    self.entries[entry['path']] = entry
+                    line_num += 1
+
+        # Rewrite the file without the outdated entries of re-checked folders
+        if line_num > len(self.entries):
+            with open(self.index_path, 'w') as file:
+                for entry in self.entries.values():
+                    file.write(json.dumps(entry) + '\n')
+
+    def lookup(self, check_path: str, fingerprint: str):
+        """!
+        @brief Returns the stored results of a folder if its fingerprint did not change.
+
+        @return Tuple containing the result, JSON report, Excel report, performance report (None, the folder is not checked)
+                and detailed check records, or None.
+        """
+        entry = self.entries.get(os.path.abspath(check_path))
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return None
+        return entry['result'], entry['json_report'], entry['excel_report'], None, entry.get('check_records')
+
+    def store(self, check_path: str, fingerprint: str, check_result):
+        """!
+        @brief Appends the results of a checked folder to the index.
+        """
+        result, json_report, excel_report = check_result[:3]
+        entry = {'path': os.path.abspath(check_path), 'fingerprint': fingerprint, 'result': bool(result),
+                 'json_report': json_report, 'excel_report': excel_report}
+        if len(check_result) > 4 and check_result[4] is not None:
+            entry['check_records'] = check_result[4]
+        self.entries[entry['path']] = entry
+        with open(self.index_path, 'a') as file:
+            file.write(json.dumps(entry) + '\n')
+
+
 class Inspector():
     """!
     @brief Performs checks on the given directory and produces reports in JSON and Excel formats.
 
     Methods:
-    - `__init__(root_path: str = '', enable_report=False, json_path: str = '', light_mode=True, excel_path='')`: Initializes the Inspector class.
+    - `__init__(root_path: str = '', enable_report=False, json_path: str = '', light_mode=True, excel_path='', workers=1, excel_streaming=False, incremental=False, only=None, check_threads=1, prefetch=0, timing_csv=None, report_format='pretty', results_exporter=None)`: Initializes the Inspector class.
     - `run()`: Executes the check process.
 
     Attributes:
@@ -125,12 +525,22 @@ class Inspector():
     - `json_report_path`: The path where JSON reports should be saved.
     - `json_report_file`: The JSON report file.
     - `excel_report_path`: The path where Excel reports should be saved.
+    - `workers`: The number of processes used to check the recording folders.
+    - `excel_streaming`: Flag to write the Excel report with the streaming (write-only) backend.
+    - `incremental`: Flag to skip the folders unchanged since the last run, using the `InspectionIndex`.
+    - `only`: Names of the checks to run, all the registered checks if None.
+    - `check_threads`: Number of threads running the checks of one recorded file.
+    - `prefetch`: Number of recording folders read ahead in background threads, 0 to disable.
+    - `timing_csv`: Path of the CSV file receiving the timings of the run, None to disable.
+    - `report_format`: Format of the JSON reports, one of `ReportGenerator.REPORT_FORMATS`.
+    - `results_exporter`: `ResultsExporter` receiving the flattened results of every checked folder, None to disable.
+    - `performance`: Stage timings of the run (checking, JSON reports and Excel phases).
     - `boolean_result`: The overall check result.
     - `print_in_terminal_result`: List of results for terminal output.
 
     """
 
-    def __init__(self, root_path: str = '', enable_report = False, json_path: str = '', light_mode=True, excel_path=''):
+    def __init__(self, root_path: str = '', enable_report = False, json_path: str = '', light_mode=True, excel_path='', workers=1, excel_streaming=False, incremental=False, only=None, check_threads=1, prefetch=0, timing_csv=None, report_format='pretty', results_exporter=None):
         """!
         @brief  Initializes the Inspector class.
 
@@ -139,6 +549,15 @@ class Inspector():
         @param json_path (str): The path where JSON reports should be saved.
         @param light_mode (bool): Flag to enable or disable light mode in reports.
         @param excel_path (str): The path where Excel reports should be saved.
+        @param workers (int): The number of processes used to check the recording folders.
+        @param excel_streaming (bool): Flag to write the Excel report with the streaming (write-only) backend.
+        @param incremental (bool): Flag to skip the folders unchanged since the last run.
+        @param only (list): Names of the checks to run, all the registered checks if None.
+        @param check_threads (int): Number of threads running the checks of one recorded file.
+        @param prefetch (int): Number of recording folders read ahead in background threads, 0 to disable.
+        @param timing_csv (str): Path of the CSV file receiving the stage and check timings, None to disable.
+        @param report_format (str): Format of the JSON reports: 'pretty', 'compact' or 'jsonl'.
+        @param results_exporter (ResultsExporter): Exporter of the flattened results, shared by the Inspectors of a batch; None to disable.
         """
         self.root_path = root_path
 
@@ -148,6 +567,16 @@ class Inspector():
         self.json_report_file = {}
 
         self.excel_report_path = excel_path
+        self.workers = max(1, int(workers))
+        self.excel_streaming = excel_streaming
+        self.incremental = incremental
+        self.only = only
+        self.check_threads = check_threads
+        self.prefetch = max(0, int(prefetch))
+        self.timing_csv = timing_csv
+        self.report_format = report_format
+        self.results_exporter = results_exporter
+        self.performance = {'stages': {}, 'folders': {}}
 
         self.boolean_result = None
 
@@ -159,9 +588,13 @@ class Inspector():
         
         """
 
+        run_start = time.perf_counter()
         basename = os.path.basename(self.root_path)
         if (basename).isdigit():
-            excel_report_generator = ExcelGenerator(self.excel_report_path )
+            if self.excel_streaming:
+                excel_report_generator = StreamingExcelGenerator(self.excel_report_path)
+            else:
+                excel_report_generator = ExcelGenerator(self.excel_report_path )
 
             try:
                 if not os.path.exists(self.json_report_path):
@@ -170,32 +603,101 @@ class Inspector():
                 print(" You don't have permission to export reports to the enterd path")
 
             print("\n=================================\n")
-            for folders_name in tqdm(os.listdir(self.root_path)):
+            folders_to_check = []
+            for folders_name in os.listdir(self.root_path):
                 if folders_name.isdigit() and len(folders_name) == 6:
-                    check_path = (self.root_path + '/' + folders_name)
+                    folders_to_check.append(folders_name)
+                elif folders_name not in ['json_report', 'excel_report']:
+                    print(f"#[Warning]: The Folder has an unusual folder or file: {folders_name}")
+
+            check_paths = [self.root_path + '/' + folders_name for folders_name in folders_to_check]
+
+            # Reuse the stored results of the folders unchanged since the last run
+            cached_results = {}
+            fingerprints = {}
+            if self.incremental:
+                inspection_index = InspectionIndex(os.path.join(self.json_report_path, 'inspection_index.jsonl'))
+                for check_path in check_paths:
+                    fingerprints[check_path] = folder_fingerprint(check_path, self.light_mode, self.only, self.results_exporter is not None)
+                    cached_result = inspection_index.lookup(check_path, fingerprints[check_path])
+                    if cached_result is not None:
+                        cached_results[check_path] = cached_result
+            paths_to_check = [check_path for check_path in check_paths if check_path not in cached_results]
+            light_modes = [self.light_mode] * len(paths_to_check)
+            only = [self.only] * len(paths_to_check)
+            check_threads = [self.check_threads] * len(paths_to_check)
+            # The detailed records are only needed by the results export
+            collect_metrics = [self.results_exporter is not None] * len(paths_to_check)
+            no_data_caches = [None] * len(paths_to_check)
+
+            # The checks may run in worker processes, the reports are always written here in folder order
+            executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 and len(paths_to_check) > 1 else None
+            # In a single process the next folders are read in background threads while the current one is checked
+            prefetcher = FolderPrefetcher(paths_to_check, self.prefetch, self.only) if self.prefetch and not executor else None
+            try:
+                if executor:
+                    new_results = executor.map(check_folder, paths_to_check, light_modes, only, check_threads, no_data_caches, collect_metrics)
+                elif prefetcher:
+                    data_caches = (prefetcher.take(index) for index in range(len(paths_to_check)))
+                    new_results = map(check_folder, paths_to_check, light_modes, only, check_threads, data_caches, collect_metrics)
+                else:
+                    new_results = map(check_folder, paths_to_check, light_modes, only, check_threads, no_data_caches, collect_metrics)
+                check_results = (cached_results[check_path] if check_path in cached_results else next(new_results) for check_path in check_paths)
+
+                stage_start = time.perf_counter()
+                for folders_name, check_path, check_result in tqdm(zip(folders_to_check, check_paths, check_results), total=len(check_paths)):
+                    self._add_stage_time('checking_s', stage_start)
+                    if self.incremental and check_path not in cached_results:
+                        inspection_index.store(check_path, fingerprints[check_path], check_result)
+
                     report_name = '/Report_' + folders_name
                     json_report_path = self.json_report_path + report_name
 
-                    checker = Checker(check_path, self.light_mode)
-                    self.boolean_result, self.json_report_file, tmp_excel_report = checker.run()
-
-                    if self.enable_json_report != 'false':
-                       # create the report
-                      report_generator = ReportGenerator(json_report_path, self.json_report_file, self.boolean_result, check_path)
-                      report_generator.run()
+                    self.boolean_result, self.json_report_file, tmp_excel_report, folder_performance, check_records = check_result
 
+                    # The sheets of the folder are built before its JSON report, so that it holds their timing
+                    stage_start = time.perf_counter()
                     if self.boolean_result:
                         self.print_in_terminal_result.append(f"Folder Name: {folders_name}\tCheck: Successful")
                         excel_report_generator.run(tmp_excel_report, folders_name)
                     else:
                         self.print_in_terminal_result.append(f"Folder Name: {folders_name}\tCheck: Failed")
                         excel_report_generator.run(tmp_excel_report, folders_name)
-                elif folders_name not in ['json_report', 'excel_report']:
-                    print(f"#[Warning]: The Folder has an unusual folder or file: {folders_name}")
+                    excel_time = self._add_stage_time('excel_conversion_s', stage_start)
+                    if folder_performance is not None:
+                        folder_performance['stages']['excel_conversion_s'] = excel_time
+                        self.performance['folders'][folders_name] = folder_performance
 
-            excel_report_generator.rearrange_critical_rows()
-            excel_report_generator.design_excel()
-            excel_report_generator.create_summary_sheet()
+                    stage_start = time.perf_counter()
+                    if self.enable_json_report != 'false':
+                       # create the report
+                      report_generator = ReportGenerator(json_report_path, self.json_report_file, self.boolean_result, check_path, folder_performance, self.report_format)
+                      report_generator.run()
+                    self._add_stage_time('json_report_s', stage_start)
+
+                    if self.results_exporter is not None:
+                        stage_start = time.perf_counter()
+                        self.results_exporter.append(basename, folders_name, self.json_report_file, check_records)
+                        self._add_stage_time('results_export_s', stage_start)
+                    stage_start = time.perf_counter()
+            finally:
+                if executor:
+                    executor.shutdown()
+                if prefetcher:
+                    prefetcher.shutdown()
+
+            for stage_name, excel_phase in (('excel_rearrange_s', excel_report_generator.rearrange_critical_rows),
+                                            ('excel_design_s', excel_report_generator.design_excel),
+                                            ('excel_summary_s', excel_report_generator.create_summary_sheet),
+                                            # The workbook is built in memory and written only once
+                                            ('excel_save_s', excel_report_generator.save)):
+                stage_start = time.perf_counter()
+                excel_phase()
+                self._add_stage_time(stage_name, stage_start)
+            self.performance['stages']['total_s'] = time.perf_counter() - run_start
+
+            if self.timing_csv:
+                self.write_timing_csv(self.timing_csv)
 
 
 
@@ -208,6 +710,42 @@ class Inspector():
             print(basename)
             print(f"\n#[Warning]: The path has an unusual folder or file:\n {self.root_path}")
 
+    def _add_stage_time(self, stage_name: str, stage_start: float) -> float:
+        """!
+        @brief Adds the time elapsed since 'stage_start' to a stage of the run.
+
+        @return The elapsed time in seconds.
+        """
+        elapsed = time.perf_counter() - stage_start
+        self.performance['stages'][stage_name] = self.performance['stages'].get(stage_name, 0.0) + elapsed
+        return elapsed
+
+    def write_timing_csv(self, csv_path: str):
+        """!
+        @brief Writes the stage timings of the run and of each folder, and the resource usage of every check, to a CSV file.
+
+        Stage rows have the stage name in the 'check' column prefixed with 'stage:'; the run stages have no folder.
+        The 'read_bytes' of the data loading stage of a folder include the files read ahead by a prefetching thread,
+        which are not part of the 'read_bytes' of its checks.
+
+        @param csv_path (str): The path of the CSV file.
+        """
+        if os.path.dirname(csv_path):
+            os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        columns = ['folder', 'sensor', 'file', 'check', 'wall_s', 'cpu_s', 'read_bytes', 'peak_rss_delta_kb']
+        with open(csv_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            for stage_name, seconds in self.performance['stages'].items():
+                writer.writerow({'folder': '', 'check': f'stage:{stage_name}', 'wall_s': seconds})
+            for folders_name, folder_performance in self.performance['folders'].items():
+                stage_read_bytes = folder_performance.get('stage_read_bytes', {})
+                for stage_name, seconds in folder_performance['stages'].items():
+                    writer.writerow({'folder': folders_name, 'check': f'stage:{stage_name}', 'wall_s': seconds,
+                                     'read_bytes': stage_read_bytes.get(stage_name, '')})
+                for check_performance in folder_performance['checks']:
+                    writer.writerow({'folder': folders_name} | check_performance)
+
 # @} ##
 
 
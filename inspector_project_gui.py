@@ -9,11 +9,11 @@ import os
 
 def run_inspector():
     """
-    @brief Run the Inspector module multiple times.
+    @brief Run the Inspector module on all the session folders.
 
     This function retrieves folder path, JSON report path, Excel report path,
     enable report flag, and light mode flag from the GUI, and runs the Inspector
-    module using the provided parameters.
+    module once in batch mode using the provided parameters.
     """
     folder_path = folder_path_entry.get()
     json_report_path = json_report_path_entry.get()
@@ -21,18 +21,17 @@ def run_inspector():
     enable_report = enable_report_var.get()
     light_mode = light_mode_var.get()
 
-    # Loop to run the Inspector module multiple times
-    for name in os.listdir(folder_path):
-        folder_name = "/" + name
-        subprocess.run([
-            'python3' if os.name == 'posix' else 'python',
-            os.path.join(os.path.dirname(__file__), 'arg_parser.py'),
-            '-f', f'{folder_path}{folder_name}',
-            '-e', str(enable_report),
-            '-j', f'{json_report_path}/json_report/{folder_name}',
-            '-l', str(light_mode),
-            '-x', f'{excel_report_path}/excel_report/{folder_name}'
-        ])
+    # Run the Inspector module once, in batch mode, for all the session folders
+    subprocess.run([
+        'python3' if os.name == 'posix' else 'python',
+        os.path.join(os.path.dirname(__file__), 'arg_parser.py'),
+        '--batch',
+        '-f', folder_path,
+        '-e', str(enable_report),
+        '-j', json_report_path,
+        '-l', str(light_mode),
+        '-x', excel_report_path
+    ])
 
     result_label.config(text="Inspector has finished running.")
 
@@ -6,8 +6,8 @@
 #
 # @details
 # This script prompts the user for configuration settings, including folder paths,
-# report paths, and configuration options. It then runs the Inspector module multiple times
-# based on the specified folder path and generates JSON and Excel reports.
+# report paths, and configuration options. It then runs the Inspector module in batch mode
+# on every session folder of the specified folder path and generates JSON and Excel reports.
 #
 # @author Your Name
 # @date January 1, 2023
@@ -76,23 +76,14 @@ elif [ "$light_mode" != true ] && [ "$light_mode" != false ]; then
 
 fi
 
-PYTHON_SCRIPT="root_founder.py"
+# Run the Inspector once for every session folder of the entered path
+python3 arg_parser.py --batch -f "$folder_path" -e $enable_report -j "$json_report_path" -l $light_mode -x "$excel_report_path"
 
-result_paths=$(python3 "$PYTHON_SCRIPT" "$folder_path")
-
-if [ -z "$result_paths" ]; then
-    echo "Error: Python script did not return valid result."
+if [ $? -ne 0 ]; then
+    echo "Error: Inspector did not finish successfully."
     exit 1
 fi
 
-# Loop to run the Inspector module multiple times
-for path in $result_paths; do
-    for name in "$path"/*; do
-        folder_name="/$(basename "$name")"
-        python3 arg_parser.py -f "$folder_path$folder_name" -e $enable_report -j "${json_report_path}/json_report/${folder_name}" -l $light_mode -x "${excel_report_path}/excel_report/${folder_name}" 
-    done
-done
-
 
 echo -e "\n #[Info] The Json Report saved :\n ${excel_report_path}"
 echo -e "\n #[Info] The Excel Report saved :\n ${json_report_path}\n"